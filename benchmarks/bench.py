@@ -0,0 +1,272 @@
+"""
+Benchmark suite for step, stats and render throughput.
+
+Measures steps per second of every engine, population stats latency and the
+frame time of each render component over a matrix of grid sizes, densities,
+species counts and cell sizes, with fixed seeds and a headless video driver.
+Render runs also measure the time from process launch to the first frame.
+
+    python -m benchmarks.bench --output bench.json
+    python -m benchmarks.bench --output new.json --compare bench.json
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Must be set before pygame is imported
+
+import argparse
+import copy
+import json
+import platform
+import sys
+import time
+import numpy as np
+from config import (
+    GRID_SIZE, SPECIES, STATS_GRAPH_HEIGHT, STATS_GRAPH_STEPS, STATS_UPDATE_RATE, CONTROL_PANEL_WIDTH, PADDING,
+    WINDOW_SIZE, CELL_SIZE
+)
+from src.engines import ENGINES, create_grid
+from src.history import PopulationHistory
+from benchmarks.startup import time_to_first_frame
+
+# Benchmark matrix
+GRID_SIZES = [100, 300]
+DENSITIES = [0.1, 0.4]
+SPECIES_COUNTS = [4, 16, 256]
+CELL_SIZES = [2, 4, 8]
+VIEW_SIZES = [1000, 4000]  # World sizes of the world view benchmark (with a random 40% density)
+QUICK_MATRIX = {'sizes': [100], 'densities': [0.1], 'species_counts': [4], 'cell_sizes': [8], 'view_sizes': [1000]}
+
+# Samples in the population history drawn by the graph benchmark
+HISTORY_SAMPLES = 100000
+
+# The per-cell reference engine is too slow to be useful on larger grids
+MAX_PYTHON_ENGINE_SIZE = 100
+
+SEED = 12345
+MIN_TIME = 0.5  # Seconds each measurement runs at least
+MIN_CALLS = 3
+STARTUP_RUNS = 5  # Fresh processes launched to measure the time to first frame
+
+def make_species(species_count, density, size):
+    """Create species definitions that fill `density` of a size x size grid.
+
+    The configured species are reused (cycled for larger counts) with start
+    areas covering the whole grid so any density can be placed. Start areas
+    are given for GRID_SIZE; the grid scales them to its actual size.
+    """
+    rng = np.random.default_rng(SEED)
+    base = list(SPECIES.values())
+    per_species = int(density * size * size / species_count)
+    species = {}
+    for species_id in range(1, species_count + 1):
+        species_data = copy.deepcopy(base[(species_id - 1) % len(base)])
+        if species_id > len(base):
+            species_data['name'] = f"Species {species_id}"
+            species_data['color'] = tuple(int(value) for value in rng.integers(40, 256, 3))
+        species_data['initial_count'] = per_species
+        species_data['start_area'] = (0, 0, GRID_SIZE, GRID_SIZE)
+        species[species_id] = species_data
+    return species
+
+def time_per_call(function, min_time=MIN_TIME, min_calls=MIN_CALLS):
+    """Get the mean wall time in seconds of one call of `function`, after one untimed warm-up call."""
+    function()  # One-time costs such as JIT compilation and lazily built tables
+    calls = 0
+    start = time.perf_counter()
+    while calls < min_calls or time.perf_counter() - start < min_time:
+        function()
+        calls += 1
+    return (time.perf_counter() - start) / calls
+
+def bench_steps(matrix):
+    """Measure steps per second and stats latency of every engine."""
+    results = []
+    for engine in ENGINES:
+        for size in matrix['sizes']:
+            if engine == 'python' and size > MAX_PYTHON_ENGINE_SIZE:
+                continue
+            for density in matrix['densities']:
+                for species_count in matrix['species_counts']:
+                    species = make_species(species_count, density, size)
+                    grid = create_grid(engine, SEED, species, size)
+                    params = {'engine': engine, 'size': size, 'density': density, 'species': species_count}
+                    step_time = time_per_call(grid.step)
+                    stats_time = time_per_call(grid.stats, min_time=0.1, min_calls=100)
+                    grid.close()
+                    results.append(_result('steps_per_second', params, 1 / step_time, 'steps/s', True))
+                    results.append(_result('stats_latency', params, stats_time * 1e6, 'us', False))
+    return results
+
+def bench_render(matrix):
+    """Measure the frame time of each render component."""
+    import pygame
+    from src.renderer import Renderer
+    from src.ui.cells import CellLayer
+    from src.ui.graph import PopulationGraph
+    from src.ui.viewport import Viewport
+
+    pygame.init()
+    results = []
+    for size in matrix['sizes']:
+        for density in matrix['densities']:
+            for species_count in matrix['species_counts']:
+                species = make_species(species_count, density, size)
+                grid = create_grid('vectorized', SEED, species, size)
+                surface = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
+                for cell_size in matrix['cell_sizes']:
+                    params = {'size': size, 'density': density, 'species': species_count, 'cell_size': cell_size}
+                    viewport = Viewport(size, WINDOW_SIZE, cell_size)
+                    for show_grid in (False, True):
+                        layer = CellLayer(species, show_grid)
+                        frame_time = time_per_call(lambda: layer.draw(surface, viewport.sample(grid.grid), viewport))
+                        results.append(_result(
+                            'render_cells', dict(params, show_grid=show_grid), frame_time * 1e3, 'ms', False
+                        ))
+
+                # Population graph over a long run
+                graph = PopulationGraph(CONTROL_PANEL_WIDTH - PADDING * 2, STATS_GRAPH_HEIGHT, STATS_GRAPH_STEPS)
+                history = PopulationHistory(species.keys())
+                final_stats = grid.stats()
+                for sample in range(1, HISTORY_SAMPLES + 1):
+                    history.append(sample * STATS_UPDATE_RATE, {
+                        species_id: count * sample // HISTORY_SAMPLES for species_id, count in final_stats.items()
+                    })
+                panel = pygame.Surface((CONTROL_PANEL_WIDTH, 400), pygame.SRCALPHA)
+                frame_time = time_per_call(lambda: graph.draw(panel, (0, 0), history, species))
+                params = {'size': size, 'density': density, 'species': species_count}
+                results.append(_result('render_graph', params, frame_time * 1e3, 'ms', False))
+
+                # The same graph when every frame brings a new sample
+                sample = [HISTORY_SAMPLES]
+
+                def updated_graph():
+                    sample[0] += 1
+                    history.append(sample[0] * STATS_UPDATE_RATE, final_stats)
+                    graph.draw(panel, (0, 0), history, species)
+
+                frame_time = time_per_call(updated_graph)
+                results.append(_result('render_graph_update', params, frame_time * 1e3, 'ms', False))
+                grid.close()
+
+    # Whole frames at the configured window size
+    grid = create_grid('vectorized', SEED)
+    renderer = Renderer(grid.species)
+    stats = grid.stats()
+    step = [0]
+
+    def full_frame():
+        renderer.invalidate()
+        renderer.draw(grid.grid, stats, 30, False, 0, {})
+
+    def stepped_frame():
+        grid.step()
+        step[0] += 1
+        renderer.draw(grid.grid, grid.stats(), 30, False, step[0], {})
+
+    def idle_frame():
+        renderer.draw(grid.grid, stats, 30, True, step[0], {})
+
+    renderer.draw(grid.grid, stats, 30, False, 0, {})
+    results.append(_result('render_frame_full', {}, time_per_call(full_frame) * 1e3, 'ms', False))
+    results.append(_result('render_frame_panel', {}, time_per_call(
+        lambda: renderer._draw_control_panel(stats, 30, {})
+    ) * 1e3, 'ms', False))
+    results.append(_result('render_frame_stepped', {}, time_per_call(stepped_frame) * 1e3, 'ms', False))
+    results.append(_result('render_frame_idle', {}, time_per_call(idle_frame) * 1e3, 'ms', False))
+    grid.close()
+
+    # The world view of large worlds, whole (zoomed out) and at the configured zoom
+    rng = np.random.default_rng(SEED)
+    surface = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
+    for size in matrix['view_sizes']:
+        cells = rng.integers(1, len(SPECIES) + 1, (size, size), dtype=np.uint8)
+        cells[rng.random((size, size)) >= 0.4] = 0
+        layer = CellLayer(SPECIES)
+        for zoom in ('fit', 'cell_size'):
+            viewport = Viewport(size, WINDOW_SIZE)
+            while zoom == 'cell_size' and (viewport.zoomed_out or viewport.cell_pixels < CELL_SIZE):
+                viewport.zoom(1)
+            frame_time = time_per_call(lambda: layer.draw(surface, viewport.sample(cells), viewport))
+            results.append(_result('render_view', {'size': size, 'zoom': zoom}, frame_time * 1e3, 'ms', False))
+    pygame.quit()
+    return results
+
+def bench_startup():
+    """Measure the median time from process launch to the first frame."""
+    return [_result('time_to_first_frame', {}, np.median(time_to_first_frame(STARTUP_RUNS)), 'ms', False)]
+
+def compare(results, baseline, threshold):
+    """Compare results with a baseline, returning (key, baseline, current, change) of regressions."""
+    baseline_values = {_key(result): result for result in baseline['results']}
+    regressions = []
+    for result in results['results']:
+        reference = baseline_values.get(_key(result))
+        if reference is None or reference['value'] == 0:
+            continue
+        change = (result['value'] - reference['value']) / reference['value']
+        worse = -change if result['higher_is_better'] else change
+        if worse > threshold:
+            regressions.append((_key(result), reference['value'], result['value'], change))
+    return regressions
+
+def _result(name, params, value, unit, higher_is_better):
+    """Create one machine-readable result entry."""
+    return {
+        'name': name,
+        'params': params,
+        'value': float(value),
+        'unit': unit,
+        'higher_is_better': higher_is_better,
+    }
+
+def _key(result):
+    """Get the identity of a result for comparisons."""
+    return result['name'] + ''.join(f" {key}={value}" for key, value in sorted(result['params'].items()))
+
+def main():
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmarks for the life simulation")
+    parser.add_argument('--output', default='bench.json', help="Results file")
+    parser.add_argument('--compare', default=None, help="Baseline results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.15, help="Relative slowdown that counts as a regression")
+    parser.add_argument('--quick', action='store_true', help="Run a single point of the matrix")
+    parser.add_argument('--skip-render', action='store_true', help="Only benchmark stepping and stats")
+    args = parser.parse_args()
+
+    matrix = QUICK_MATRIX if args.quick else {
+        'sizes': GRID_SIZES,
+        'densities': DENSITIES,
+        'species_counts': SPECIES_COUNTS,
+        'cell_sizes': CELL_SIZES,
+        'view_sizes': VIEW_SIZES,
+    }
+    results = bench_steps(matrix)
+    if not args.skip_render:
+        results += bench_render(matrix)
+        results += bench_startup()
+
+    output = {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'seed': SEED,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as output_file:
+        json.dump(output, output_file, indent=2)
+    for result in results:
+        print(f"{_key(result)}: {result['value']:.3f} {result['unit']}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(output, json.load(baseline_file), args.threshold)
+        for key, reference, value, change in regressions:
+            print(f"REGRESSION {key}: {reference:.3f} -> {value:.3f} ({change:+.1%})")
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+
+if __name__ == "__main__":
+    main()
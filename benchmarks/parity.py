@@ -0,0 +1,70 @@
+"""
+Parity check between a step engine and the reference engine.
+
+Runs both engines from the same seeds and reports how many runs are identical
+step for step. Then runs them from disjoint seeds and compares the mean
+population trajectories of every species: at each checked step the difference
+of the means must stay within `--tolerance` standard errors. Exits with
+status 1 if the trajectories are distinguishable.
+
+    python -m benchmarks.parity --engine jit
+    python -m benchmarks.parity --engine vectorized --runs 30
+"""
+
+import argparse
+import sys
+import numpy as np
+from src.engines import ENGINES
+from src.headless import run_headless
+
+REFERENCE_ENGINE = 'python'
+CHECKS = 10  # Evenly spaced steps at which the trajectories are compared
+
+def run_trajectories(engine, seeds, steps, size):
+    """Get the population trajectories (runs, steps + 1, species) of an engine."""
+    return np.stack([
+        run_headless(steps, seed, engine=engine, size=size)['populations'] for seed in seeds
+    ])
+
+def compare_trajectories(reference, candidate, tolerance):
+    """Get the largest difference of the mean populations in standard errors, and whether it is within tolerance."""
+    checked = np.linspace(0, reference.shape[1] - 1, CHECKS + 1).astype(int)[1:]
+    reference, candidate = reference[:, checked], candidate[:, checked]
+    standard_error = np.sqrt(
+        reference.var(axis=0, ddof=1) / len(reference) + candidate.var(axis=0, ddof=1) / len(candidate)
+    )
+    difference = np.abs(reference.mean(axis=0) - candidate.mean(axis=0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = difference / standard_error
+    # Populations that never vary (e.g. always extinct) must match exactly
+    scores[(standard_error == 0) & (difference == 0)] = 0
+    score = float(scores.max())
+    return score, score <= tolerance
+
+def main():
+    """Run the parity check from the command line."""
+    parser = argparse.ArgumentParser(description="Compare an engine against the reference engine")
+    parser.add_argument('--engine', default='jit', help="Engine to check")
+    parser.add_argument('--runs', type=int, default=20, help="Runs per engine")
+    parser.add_argument('--steps', type=int, default=200, help="Steps per run")
+    parser.add_argument('--size', type=int, default=50, help="Grid size")
+    parser.add_argument('--tolerance', type=float, default=4.0, help="Allowed difference in standard errors")
+    args = parser.parse_args()
+    if args.engine not in ENGINES:
+        parser.error(f"engine '{args.engine}' is not available, choose one of: {', '.join(ENGINES)}")
+
+    seeds = list(range(args.runs))
+    reference = run_trajectories(REFERENCE_ENGINE, seeds, args.steps, args.size)
+    candidate = run_trajectories(args.engine, seeds, args.steps, args.size)
+    identical = int(sum(np.array_equal(ref, cand) for ref, cand in zip(reference, candidate)))
+    print(f"{identical}/{args.runs} runs identical to the {REFERENCE_ENGINE} engine from the same seed")
+
+    # Disjoint seeds, so identical runs do not make the comparison trivially pass
+    candidate = run_trajectories(args.engine, [seed + args.runs for seed in seeds], args.steps, args.size)
+    score, passed = compare_trajectories(reference, candidate, args.tolerance)
+    print(f"Largest difference of mean populations: {score:.2f} standard errors (tolerance {args.tolerance})")
+    print("Trajectories are statistically indistinguishable" if passed else "Trajectories differ")
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main()
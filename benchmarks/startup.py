@@ -0,0 +1,69 @@
+"""
+Time-to-first-frame check.
+
+Launches fresh interpreters that create the simulation and draw its first
+frame, and reports the median wall time from process launch to that frame.
+Exits with status 1 if it is above `--target` milliseconds.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --target 400
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Must be set before pygame is imported
+
+import argparse
+import subprocess
+import sys
+import time
+import numpy as np
+
+TARGET_MS = 500  # Default time-to-first-frame target
+SEED = 12345
+
+def first_frame(launch_time):
+    """Create the simulation, draw its first frame and print the milliseconds since launch."""
+    from src.simulation import Simulation
+    simulation = Simulation(seed=SEED)
+    simulation.renderer.draw(
+        simulation.grid.grid,
+        simulation.grid.stats(),
+        simulation.worker.scheduler.steps_per_second,
+        False,
+        simulation.step_count,
+        simulation.extinction_data
+    )
+    print((time.time() - launch_time) * 1e3)
+
+def time_to_first_frame(runs):
+    """Get the time to first frame in milliseconds of each of `runs` fresh processes."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.startup', '--child', repr(time.time())],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        times.append(float(output.split()[-1]))
+    return times
+
+def main():
+    """Run the startup check from the command line."""
+    parser = argparse.ArgumentParser(description="Measure the time to the first frame")
+    parser.add_argument('--runs', type=int, default=5, help="Launches to measure")
+    parser.add_argument('--target', type=float, default=TARGET_MS, help="Target median in milliseconds")
+    parser.add_argument('--child', type=float, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child is not None:
+        first_frame(args.child)
+        return
+
+    times = time_to_first_frame(args.runs)
+    median = float(np.median(times))
+    print(f"Time to first frame: median {median:.0f} ms, min {min(times):.0f} ms, max {max(times):.0f} ms")
+    print(f"Within the {args.target:.0f} ms target" if median <= args.target else f"Above the {args.target:.0f} ms target")
+    sys.exit(0 if median <= args.target else 1)
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 Display configuration parameters.
 """
 
+import os
+
 # Window settings
 WINDOW_TITLE = "Life Simulation"
 
@@ -14,6 +16,9 @@ PANEL_BORDER_COLOR = (48, 54, 61)  # Subtle border
 GRADIENT_TOP = (22, 27, 34)  # Top color for background gradient
 GRADIENT_BOTTOM = (13, 17, 23)  # Bottom color for background gradient
 
+# Dirty-region rendering: cells are repainted in square blocks of this many cells
+DIRTY_BLOCK_SIZE = 10
+
 # UI Elements
 TITLE_BAR_HEIGHT = 48  # Slightly taller for better spacing
 CONTROL_PANEL_WIDTH = 240  # Wider panel for better layout
@@ -26,11 +31,22 @@ STATS_UPDATE_RATE = 30
 STATS_FONT_SIZE = 14
 STATS_TITLE_FONT_SIZE = 18
 STATS_FONT = "Arial"  # Changed from Segoe UI for better compatibility
+# Resolved system font files, reused across launches (None disables); kept in the per-user cache directory
+FONT_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'pixel-life',
+    'font_cache.json'
+)
 STATS_COLOR = (201, 209, 217)  # Softer text color
 STATS_TITLE_COLOR = (255, 255, 255)
 EXTINCT_COLOR = (229, 83, 75)  # Red color for extinct species
 STATS_GRAPH_HEIGHT = 100  # Height for population graphs
-STATS_HISTORY_LENGTH = 100  # Number of data points to keep
+STATS_GRAPH_STEPS = None  # Steps shown in the population graph (None shows the whole run)
+STATS_HISTORY_CAPACITY = 1024  # Samples kept per resolution level of the population history
+STATS_HISTORY_FACTOR = 4  # Entries merged into one bucket of the next coarser level
+STATS_HISTORY_SPILL_PATH = None  # File that receives every raw sample (None keeps history in memory only)
+STATS_SPECIES_LIMIT = 10  # Species listed in the panel; with more, the largest populations are listed
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept for reuse (least recently used are dropped)
 
 # Control panel settings
 BUTTON_COLOR = (33, 138, 255)  # Modern blue
@@ -2,14 +2,25 @@
 Grid configuration parameters.
 """
 
-# Grid dimensions and cell size
+# Grid dimensions and the world view: the view is WINDOW_SIZE pixels square and
+# starts at CELL_SIZE pixels per cell, zoomed out until the whole grid fits
 GRID_SIZE = 100
 CELL_SIZE = 8
-WINDOW_SIZE = GRID_SIZE * CELL_SIZE
+WINDOW_SIZE = 800
+MAX_CELL_SIZE = 32  # Largest zoom in pixels per cell
+LOD_SAMPLES = 3  # Zoomed out, cells sampled per block side for the majority vote
+
+# Store cells in the smallest integer type that fits every species id (uint8 for up to 255 species)
+COMPACT_STORAGE = True
 
 # Movement settings
 MOVEMENT_DIRECTIONS = [
     (-1, -1), (-1, 0), (-1, 1),
     (0, -1),           (0, 1),
     (1, -1),  (1, 0),  (1, 1)
-] 
\ No newline at end of file
+] 
+# World layout: "moore" (8 neighbours), "von_neumann" (4) or "hex" (6), with edges
+# that wrap around (torus) or act as walls
+NEIGHBOURHOOD = "moore"
+WRAP_EDGES = True
+NEIGHBOUR_TABLE_LIMIT = 2 ** 24  # Largest precomputed neighbour table (larger grids compute neighbours per step)
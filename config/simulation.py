@@ -2,5 +2,49 @@
 Simulation configuration parameters.
 """
 
-# Simulation speed
-FRAME_RATE = 30 
\ No newline at end of file
+# Display frame rate (independent of the simulation step rate)
+FRAME_RATE = 30
+IDLE_FRAME_RATE = 10  # Frame rate while paused and nothing on screen changes
+
+# Simulation speed presets in steps per second (None is turbo: as many steps as fit in a frame)
+SPEED_LEVELS = [1, 2, 5, 10, 15, 30, 60, 120, 240, 500, 1000, 2000, 5000, None]
+DEFAULT_SPEED_LEVEL = 5  # 30 steps per second
+STEP_TIME_BUDGET = 0.8  # Share of each frame that may be spent stepping
+
+# Step the grid on a background thread that publishes double-buffered snapshots
+BACKGROUND_STEPPING = False
+
+# Step engine: "python" (per-cell reference loop), "vectorized" (whole-array NumPy),
+# "sparse" (occupied-cell index) or "tiled" (multi-process tiles)
+ENGINE = "python"
+
+# Tiled engine: rows per band stepped in parallel (at least 2), and worker processes (None: all cores).
+# The bands set the random streams, so their number follows the grid size rather than the cores.
+TILE_ROWS = 16
+TILE_WORKERS = None
+
+# Cross-check the incrementally maintained population counts against a full recount
+DEBUG_POPULATION_COUNTS = False
+
+# Checkpoints: the S key saves to CHECKPOINT_PATH, and every AUTOSAVE_INTERVAL steps
+# (0 disables autosave) the state is saved in the background and once more on exit
+CHECKPOINT_PATH = "simulation.ckpt"
+AUTOSAVE_INTERVAL = 0
+
+# Recordings store a full keyframe every this many steps (deltas in between)
+RECORD_KEYFRAME_INTERVAL = 100
+
+# Profiling: per-phase timers shown in the title bar (P toggles, T exports a Chrome trace)
+ENABLE_PROFILING = False
+PROFILE_WINDOW = 120  # Samples per phase in the rolling statistics
+PROFILE_TRACE_LIMIT = 100000  # Most recent phases kept for trace export
+PROFILE_TRACE_PATH = "trace.json"
+PROFILE_OVERLAY_PHASES = 5  # Slowest phases listed in the overlay (mean/p95 in ms)
+
+# Spatial statistics (clusters, fronts between species, density histograms, centroids) computed
+# every SPATIAL_STATS_INTERVAL steps (0 disables them) in the background and appended to a JSON lines file
+SPATIAL_STATS_INTERVAL = 0
+SPATIAL_STATS_PATH = "spatial_stats.jsonl"
+SPATIAL_STATS_PANEL = False  # Show cluster and front summaries in the control panel
+SPATIAL_DENSITY_WINDOW = 10  # Side of the windows the local density is measured in, in cells
+SPATIAL_DENSITY_BINS = 10  # Bins of the local density histograms
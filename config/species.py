@@ -44,5 +44,10 @@ SPECIES = {
     }
 }
 
+# Optional explicit combat outcomes: {(attacker_id, defender_id): chance the attacker wins}.
+# Pairs not listed use attacker_strength / (attacker_strength + defender_strength), and a
+# pair may be asymmetric, e.g. {(1, 3): 0.6, (3, 1): 0.2}
+COMBAT_MATCHUPS = {}
+
 # Total number of species
 SPECIES_COUNT = len(SPECIES) 
\ No newline at end of file
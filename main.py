@@ -2,12 +2,52 @@
 Entry point for the life simulation.
 """
 
-from src.simulation import Simulation
+import argparse
+from config import ENGINE, GRID_SIZE, BACKGROUND_STEPPING, ENABLE_PROFILING, SPATIAL_STATS_INTERVAL
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Pixel life simulation")
+    parser.add_argument('--headless', action='store_true', help="Run without a window (no pygame)")
+    parser.add_argument('--steps', type=int, default=1000, help="Number of steps in headless mode")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    parser.add_argument('--output', default='results.npz', help="Results file in headless mode")
+    parser.add_argument('--engine', default=ENGINE, help="Step engine to use")
+    parser.add_argument('--size', type=int, default=GRID_SIZE, help="Grid size")
+    parser.add_argument('--background', action='store_true', default=BACKGROUND_STEPPING,
+                        help="Step the grid on a background thread")
+    parser.add_argument('--restore', default=None, help="Continue from a checkpoint file")
+    parser.add_argument('--record', default=None, help="Record the run to a file")
+    parser.add_argument('--replay', default=None, help="Play back a recording instead of simulating")
+    parser.add_argument('--profile', action='store_true', default=ENABLE_PROFILING,
+                        help="Time each frame phase and export a trace on exit")
+    parser.add_argument('--spatial-stats', type=int, default=SPATIAL_STATS_INTERVAL, metavar='K',
+                        help="Append spatial statistics to a file every K steps (0 disables them)")
+    return parser.parse_args()
 
 def main():
     """Initialize and run the simulation."""
-    simulation = Simulation()
+    args = parse_args()
+    if args.headless:
+        # Imported lazily so headless runs never load pygame
+        from src.headless import run_headless
+        run_headless(
+            args.steps, args.seed, args.output, args.engine, size=args.size, record_path=args.record,
+            spatial_interval=args.spatial_stats
+        )
+        return
+
+    if args.replay:
+        from src.replay_viewer import ReplayViewer
+        ReplayViewer(args.replay).run()
+        return
+
+    from src.simulation import Simulation
+    simulation = Simulation(
+        args.engine, args.seed, args.background, args.restore, args.record, args.profile, args.size,
+        args.spatial_stats
+    )
     simulation.run()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
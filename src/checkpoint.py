@@ -0,0 +1,136 @@
+"""
+Binary checkpoints of the full simulation state.
+
+Layout of a checkpoint file:
+    8 bytes   magic b"PLSCKPT1"
+    8 bytes   little-endian header length
+    header    UTF-8 JSON (engine, species, step count, extinction data,
+              population history and the exact engine/RNG state)
+    padding   up to a 64-byte boundary
+    payload   the cells, nibble-packed (two cells per byte) when every species
+              id fits in four bits, otherwise raw in the grid dtype
+
+The payload is never stream-compressed, so it can be memory mapped and
+unpacked with whole-array operations on load.
+"""
+
+import json
+import os
+import threading
+import numpy as np
+from src.engines import create_grid
+
+MAGIC = b"PLSCKPT1"
+ALIGNMENT = 64
+
+def capture_state(simulation):
+    """Copy everything a checkpoint needs; fast enough to call between steps."""
+    worker = simulation.worker
+    with worker.step_lock:
+        grid = worker.grid.snapshot()
+        header = {
+            'engine': simulation.engine,
+            'species': list(worker.grid.species.items()),
+            'engine_state': worker.grid.get_state(),
+            'step_count': worker.step_count,
+            'extinction_data': list(worker.extinction_data.items()),
+        }
+    header['population_history'] = simulation.renderer.population_history.get_state()
+    return grid, header
+
+def write_checkpoint(path, grid, header):
+    """Write a captured state to `path`, replacing any previous file atomically."""
+    max_value = int(grid.max()) if grid.size else 0
+    cells = grid.reshape(-1)
+    if max_value < 16:
+        # Two cells per byte, high nibble first
+        if len(cells) % 2:
+            cells = np.append(cells, 0)
+        payload = ((cells[0::2] << 4) | cells[1::2]).astype(np.uint8)
+        packing = 'nibble'
+    else:
+        payload = cells
+        packing = 'raw'
+    header = dict(header, shape=list(grid.shape), dtype=grid.dtype.str, packing=packing)
+
+    header_bytes = json.dumps(header).encode('utf-8')
+    payload_offset = _align(len(MAGIC) + 8 + len(header_bytes))
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as checkpoint_file:
+        checkpoint_file.write(MAGIC)
+        checkpoint_file.write(len(header_bytes).to_bytes(8, 'little'))
+        checkpoint_file.write(header_bytes)
+        checkpoint_file.write(b'\0' * (payload_offset - checkpoint_file.tell()))
+        payload.tofile(checkpoint_file)
+    os.replace(temp_path, path)
+
+def save_checkpoint(path, simulation):
+    """Save the simulation state to `path`."""
+    write_checkpoint(path, *capture_state(simulation))
+
+def read_checkpoint(path):
+    """Read a checkpoint, returning the cells and the header."""
+    with open(path, 'rb') as checkpoint_file:
+        if checkpoint_file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a simulation checkpoint")
+        header_length = int.from_bytes(checkpoint_file.read(8), 'little')
+        header = json.loads(checkpoint_file.read(header_length).decode('utf-8'))
+    payload_offset = _align(len(MAGIC) + 8 + header_length)
+
+    shape = tuple(header['shape'])
+    dtype = np.dtype(header['dtype'])
+    cell_count = shape[0] * shape[1]
+    if header['packing'] == 'nibble':
+        payload = np.memmap(path, dtype=np.uint8, mode='r', offset=payload_offset, shape=((cell_count + 1) // 2,))
+        cells = np.empty(len(payload) * 2, dtype=dtype)
+        np.right_shift(payload, 4, out=cells[0::2], casting='unsafe')
+        np.bitwise_and(payload, 0x0F, out=cells[1::2], casting='unsafe')
+        grid = cells[:cell_count].reshape(shape)
+    else:
+        grid = np.memmap(path, dtype=dtype, mode='r', offset=payload_offset, shape=shape)
+
+    # JSON turns integer keys into strings and tuples into lists
+    header['species'] = {int(species_id): data for species_id, data in header['species']}
+    header['extinction_data'] = {int(species_id): step for species_id, step in header['extinction_data']}
+    return grid, header
+
+def restore_grid(grid, header):
+    """Create an engine from a checkpoint and restore its exact state."""
+    restored = create_grid(header['engine'], None, header['species'], grid.shape[0])
+    restored.set_state(grid, header['engine_state'])
+    return restored
+
+class Autosaver:
+    def __init__(self, path, interval):
+        """Initialize periodic saves every `interval` steps (0 disables them)."""
+        self.path = path
+        self.interval = interval
+        self.last_step = 0
+        self.thread = None
+
+    def update(self, simulation):
+        """Start a background save when the interval has passed and no save is running."""
+        if not self.interval or simulation.step_count - self.last_step < self.interval:
+            return
+        if self.thread is not None and self.thread.is_alive():
+            return  # Still writing the previous checkpoint
+        self.last_step = simulation.step_count
+
+        # Only the copy happens on the calling thread, packing and writing do not
+        grid, header = capture_state(simulation)
+        self.thread = threading.Thread(
+            target=write_checkpoint,
+            args=(self.path, grid, header),
+            name="autosave",
+            daemon=True
+        )
+        self.thread.start()
+
+    def finish(self):
+        """Wait for a running save to complete."""
+        if self.thread is not None:
+            self.thread.join()
+
+def _align(offset):
+    """Round an offset up to the payload alignment."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
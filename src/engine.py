@@ -0,0 +1,46 @@
+"""
+Interface shared by all step engines.
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+from config import GRID_SIZE
+
+class Engine(ABC):
+    """A world of creatures that can be stepped, counted and copied.
+    
+    Engines are created as Engine(seed, species, size), hold their cells in
+    `grid` (indexed [row, column], 0 is an empty cell) and their species
+    definitions in `species`. Grid is the reference implementation. Engines
+    missing an abstract method fail when they are created.
+    """
+    
+    @abstractmethod
+    def __init__(self, seed=None, species=None, size=GRID_SIZE):
+        """Initialize the world and place the initial creatures."""
+    
+    @abstractmethod
+    def step(self):
+        """Advance the world by one step."""
+    
+    @abstractmethod
+    def stats(self):
+        """Get the population of every species id."""
+    
+    def snapshot(self, out=None):
+        """Copy the cells into `out` (a new array by default) and return it."""
+        if out is None:
+            return self.grid.copy()
+        np.copyto(out, self.grid)
+        return out
+    
+    @abstractmethod
+    def get_state(self):
+        """Get the engine state other than the cells as JSON-compatible values."""
+    
+    @abstractmethod
+    def set_state(self, grid, state):
+        """Restore the cells and the engine state saved by get_state."""
+    
+    def close(self):
+        """Release resources held by the engine."""
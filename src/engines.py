@@ -0,0 +1,29 @@
+"""
+Step engine selection for the life simulation.
+"""
+
+from config import ENGINE, GRID_SIZE
+from src.grid import Grid
+from src.vector_grid import VectorGrid
+from src.sparse_grid import SparseGrid
+from src.tiled_grid import TiledGrid
+from src.jit_grid import JitGrid, JIT_AVAILABLE
+
+# Available step engines by name
+ENGINES = {
+    'python': Grid,
+    'vectorized': VectorGrid,
+    'sparse': SparseGrid,
+    'tiled': TiledGrid,
+}
+
+# The compiled engine needs numba
+if JIT_AVAILABLE:
+    ENGINES['jit'] = JitGrid
+
+def create_grid(engine=ENGINE, seed=None, species=None, size=GRID_SIZE):
+    """Create a grid stepped by the named engine; every engine implements the Engine interface."""
+    if engine not in ENGINES:
+        hint = " (the jit engine requires numba)" if engine == 'jit' else ""
+        raise ValueError(f"Unknown engine '{engine}'{hint}, expected one of: {', '.join(ENGINES)}")
+    return ENGINES[engine](seed, species, size)
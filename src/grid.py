@@ -3,92 +3,211 @@ Grid management for the life simulation.
 """
 
 import numpy as np
-import random
-from config import GRID_SIZE, MOVEMENT_DIRECTIONS, SPECIES
+from config import (
+    GRID_SIZE, SPECIES, COMBAT_MATCHUPS, DEBUG_POPULATION_COUNTS, COMPACT_STORAGE,
+    NEIGHBOURHOOD, WRAP_EDGES
+)
+from src.engine import Engine
+from src.storage import cell_dtype
+from src.topology import Topology
 
-class Grid:
-    def __init__(self):
+class Grid(Engine):
+    def __init__(self, seed=None, species=None, size=GRID_SIZE):
+        # Species definitions (defaults to the configured species)
+        self.species = SPECIES if species is None else species
+        
+        # Random stream for placement and behaviour (seeded runs are repeatable)
+        self.seed_entropy = np.random.SeedSequence(seed).entropy
+        self.rng = np.random.default_rng(self.seed_entropy)
+        
         # Initialize grid with zeros (empty cells)
-        self.grid = np.zeros((GRID_SIZE, GRID_SIZE), dtype=int)
+        self.size = size
+        self.grid = np.zeros((size, size), dtype=cell_dtype(max(self.species.keys()), COMPACT_STORAGE))
+        self.topology = Topology(NEIGHBOURHOOD, self.grid.shape, WRAP_EDGES)
+        self._compile_species()
         self._initialize_species()
+        
+        # Back buffer for the next step, swapped with the grid instead of reallocated
+        self.back_grid = np.empty_like(self.grid)
+        
+        # Population per species id, kept up to date as creatures move, fight and breed
+        self.population = self._count_population()
+    
+    def _compile_species(self):
+        """Build per-species parameter arrays and the combat win probability matrix, indexed by species id."""
+        table_size = max(self.species.keys()) + 1  # Index 0 is the empty cell
+        self.movement_chance = np.zeros(table_size)
+        self.reproduction_chance = np.zeros(table_size)
+        self.combat_strength = np.zeros(table_size)
+        for species_id, species_data in self.species.items():
+            self.movement_chance[species_id] = species_data['movement_chance']
+            self.reproduction_chance[species_id] = species_data['reproduction_chance']
+            self.combat_strength[species_id] = species_data['combat_strength']
+        
+        # Chance that the attacker (row) beats the defender (column): a / (a + d) unless given explicitly
+        total_strength = self.combat_strength[:, None] + self.combat_strength[None, :]
+        self.win_probability = np.divide(
+            self.combat_strength[:, None],
+            total_strength,
+            out=np.zeros((table_size, table_size)),
+            where=total_strength > 0
+        )
+        for (attacker_id, defender_id), probability in COMBAT_MATCHUPS.items():
+            if attacker_id not in self.species or defender_id not in self.species:
+                raise ValueError(
+                    f"Combat matchup ({attacker_id}, {defender_id}) names a species that is not configured"
+                )
+            if not 0 <= probability <= 1:
+                raise ValueError(
+                    f"Combat matchup ({attacker_id}, {defender_id}) has win probability {probability}, "
+                    f"which is outside [0, 1]"
+                )
+            self.win_probability[attacker_id, defender_id] = probability
+        
+        # Row lists for the per-cell loop, where list indexing beats array indexing
+        self.win_probability_rows = self.win_probability.tolist()
     
     def _initialize_species(self):
         """Place initial species in their respective areas."""
-        for species_id, species_data in SPECIES.items():
+        for species_id, species_data in self.species.items():
             placed = 0
-            x_start, y_start, x_end, y_end = species_data['start_area']
+            # Start areas are configured for GRID_SIZE, scale them to this grid
+            x_start, y_start, x_end, y_end = (
+                coordinate * self.size // GRID_SIZE for coordinate in species_data['start_area']
+            )
+            
+            # Placement draws until every creature found an empty cell, so the area must have room
+            free = int(np.count_nonzero(self.grid[x_start:x_end, y_start:y_end] == 0))
+            if species_data['initial_count'] > free:
+                raise ValueError(
+                    f"Species {species_id} ({species_data['name']}) starts with "
+                    f"{species_data['initial_count']} creatures, but its start area has only "
+                    f"{free} free cells on a {self.size}x{self.size} grid"
+                )
             while placed < species_data['initial_count']:
-                x = random.randint(x_start, x_end - 1)
-                y = random.randint(y_start, y_end - 1)
-                if self.grid[x, y] == 0:
-                    self.grid[x, y] = species_id
-                    placed += 1
+                # Draw candidate cells in bulk and keep the first draw of every empty one
+                count = species_data['initial_count'] - placed
+                xs = self.rng.integers(x_start, x_end, size=count)
+                ys = self.rng.integers(y_start, y_end, size=count)
+                candidates = xs * self.size + ys
+                _, first = np.unique(candidates, return_index=True)
+                candidates = candidates[np.sort(first)]
+                candidates = candidates[self.grid.reshape(-1)[candidates] == 0]
+                self.grid.reshape(-1)[candidates] = species_id
+                placed += len(candidates)
+    
+    def substream(self, *key):
+        """Get an independent random stream for a region of work, e.g. (step, tile)."""
+        return np.random.default_rng(np.random.SeedSequence(self.seed_entropy, spawn_key=key))
     
-    def get_population_stats(self):
+    def stats(self):
         """Get current population statistics for each species."""
-        stats = {species_id: 0 for species_id in SPECIES.keys()}
-        unique, counts = np.unique(self.grid, return_counts=True)
-        for value, count in zip(unique, counts):
-            if value != 0:  # Skip empty cells
-                stats[value] = count
-        return stats
+        if DEBUG_POPULATION_COUNTS:
+            self._check_population()
+        return {species_id: int(self.population[species_id]) for species_id in self.species.keys()}
     
-    def update(self):
+    def _count_population(self):
+        """Count every species with a full pass over the grid."""
+        return np.bincount(self.grid.reshape(-1), minlength=max(self.species.keys()) + 1)
+    
+    def _check_population(self):
+        """Cross-check the maintained counts against a full recount."""
+        counted = self._count_population()
+        for species_id in self.species.keys():
+            if counted[species_id] != self.population[species_id]:
+                raise AssertionError(
+                    f"Population of species {species_id} is {counted[species_id]}, "
+                    f"but the maintained count is {self.population[species_id]}"
+                )
+    
+    def get_state(self):
+        """Get the engine state other than the cells as JSON-compatible values."""
+        return {
+            'rng': self.rng.bit_generator.state,
+            'seed_entropy': self.seed_entropy,
+            'population': self.population.tolist(),
+        }
+    
+    def set_state(self, grid, state):
+        """Restore the cells and the engine state saved by get_state."""
+        np.copyto(self.grid, grid)
+        self.rng.bit_generator.state = state['rng']
+        self.seed_entropy = state['seed_entropy']
+        self.population = np.array(state['population'], dtype=self.population.dtype)
+    
+    def step(self):
         """Update the grid state for one simulation step."""
-        new_grid = self.grid.copy()
-        
-        for x in range(GRID_SIZE):
-            for y in range(GRID_SIZE):
-                species_id = self.grid[x, y]
-                if species_id != 0:  # If cell is not empty
-                    self._process_cell(x, y, species_id, new_grid)
+        new_grid = self.back_grid
+        np.copyto(new_grid, self.grid)
+        self._apply_step(new_grid.reshape(-1), *self._draw_step())
+        self.grid, self.back_grid = new_grid, self.grid
+    
+    def _draw_step(self):
+        """Draw every random number of the step in bulk, one set per creature in scan order."""
+        positions = np.flatnonzero(self.grid)
+        species = self.grid.reshape(-1)[positions]
+        count = len(positions)
+        degree = self.topology.degree
+        rolls = self.rng.random((3, count))
+        directions = self.rng.integers(degree, size=count)
+        orders = self.rng.permuted(np.tile(np.arange(degree), (count, 1)), axis=1)
         
-        self.grid = new_grid
+        # Decide who moves and who reproduces, and gather the cells they may move or reproduce into
+        moves = rolls[0] < self.movement_chance[species]
+        reproduces = rolls[1] < self.reproduction_chance[species]
+        move_targets = self.topology.neighbours(positions, directions)
+        birth_targets = self.topology.neighbours(positions[:, None], orders)
+        return positions, species, moves, reproduces, rolls[2], move_targets, birth_targets
     
-    def _process_cell(self, x, y, species_id, new_grid):
+    def _apply_step(self, cells, positions, species, moves, reproduces, combat_rolls, move_targets, birth_targets):
+        """Process the creatures one after another, each seeing the moves made before it."""
+        for position, species_id, cell_rolls in zip(
+            positions.tolist(),
+            species.tolist(),
+            zip(moves.tolist(), reproduces.tolist(), combat_rolls.tolist(), move_targets.tolist(), birth_targets.tolist())
+        ):
+            self._process_cell(position, species_id, cells, cell_rolls)
+    
+    def _process_cell(self, position, species_id, cells, cell_rolls):
         """Process movement and reproduction for a single cell."""
-        species_data = SPECIES[species_id]
+        moves, reproduces, combat_roll, target, birth_targets = cell_rolls
         
-        # Movement
-        if random.random() < species_data['movement_chance']:
-            self._try_movement(x, y, species_id, species_data, new_grid)
+        # Movement (nowhere to go beyond a wall)
+        if moves and target >= 0:
+            self._try_movement(position, species_id, cells, target, combat_roll)
         
         # Reproduction
-        if random.random() < species_data['reproduction_chance']:
-            self._try_reproduction(x, y, species_id, new_grid)
+        if reproduces:
+            self._try_reproduction(species_id, cells, birth_targets)
     
-    def _try_movement(self, x, y, species_id, species_data, new_grid):
+    def _try_movement(self, position, species_id, cells, target, combat_roll):
         """Attempt to move a creature to a new cell."""
-        dx, dy = random.choice(MOVEMENT_DIRECTIONS)
-        new_x = (x + dx) % GRID_SIZE
-        new_y = (y + dy) % GRID_SIZE
-        
         # If target cell is empty, move there
-        if new_grid[new_x, new_y] == 0:
-            new_grid[new_x, new_y] = species_id
-            new_grid[x, y] = 0
+        if cells[target] == 0:
+            vacated_id = cells[position]
+            cells[target] = species_id
+            cells[position] = 0
+            self.population[species_id] += 1
+            self.population[vacated_id] -= 1
         
         # If target cell contains different species, fight
-        elif new_grid[new_x, new_y] != species_id:
-            self._resolve_combat(species_id, species_data, new_x, new_y, new_grid)
+        elif cells[target] != species_id:
+            self._resolve_combat(species_id, target, cells, combat_roll)
     
-    def _resolve_combat(self, attacker_id, attacker_data, x, y, new_grid):
+    def _resolve_combat(self, attacker_id, target, cells, combat_roll):
         """Resolve combat between two creatures."""
-        defender_id = new_grid[x, y]
-        attacker_strength = attacker_data['combat_strength']
-        defender_strength = SPECIES[defender_id]['combat_strength']
+        defender_id = cells[target]
         
-        # Combat outcome based on relative strengths
-        if random.random() < attacker_strength / (attacker_strength + defender_strength):
-            new_grid[x, y] = attacker_id
+        # Combat outcome from the precomputed matchup probabilities
+        if combat_roll < self.win_probability_rows[attacker_id][defender_id]:
+            cells[target] = attacker_id
+            self.population[attacker_id] += 1
+            self.population[defender_id] -= 1
     
-    def _try_reproduction(self, x, y, species_id, new_grid):
-        """Attempt to reproduce into an adjacent empty cell."""
-        directions = list(MOVEMENT_DIRECTIONS)
-        random.shuffle(directions)
-        for dx, dy in directions:
-            reproduce_x = (x + dx) % GRID_SIZE
-            reproduce_y = (y + dy) % GRID_SIZE
-            if new_grid[reproduce_x, reproduce_y] == 0:
-                new_grid[reproduce_x, reproduce_y] = species_id
-                break 
\ No newline at end of file
+    def _try_reproduction(self, species_id, cells, birth_targets):
+        """Attempt to reproduce into an adjacent empty cell, trying neighbours in a random order."""
+        for target in birth_targets:
+            if target >= 0 and cells[target] == 0:
+                cells[target] = species_id
+                self.population[species_id] += 1
+                break
@@ -0,0 +1,66 @@
+"""
+Headless batch runner for the life simulation.
+
+Steps the grid without pygame, so it runs on machines without a display.
+"""
+
+import numpy as np
+from config import ENGINE, GRID_SIZE, RECORD_KEYFRAME_INTERVAL, SPATIAL_STATS_INTERVAL, SPATIAL_STATS_PATH
+from src.engines import create_grid
+from src.recording import Recorder
+from src.spatial import SpatialStatsRecorder
+
+def run_headless(steps, seed=None, output_path=None, engine=ENGINE, species=None, size=GRID_SIZE,
+                 record_path=None, spatial_interval=SPATIAL_STATS_INTERVAL, spatial_path=SPATIAL_STATS_PATH):
+    """Run the simulation for a number of steps and optionally save the results, a recording and spatial statistics."""
+    grid = create_grid(engine, seed, species, size)
+    recorder = None
+    if record_path is not None:
+        recorder = Recorder(record_path, grid.grid, grid.species, RECORD_KEYFRAME_INTERVAL)
+    spatial_stats = SpatialStatsRecorder(spatial_path, spatial_interval, grid.topology, grid.species.keys())
+    species_ids = np.array(sorted(grid.species.keys()))
+
+    # Population of every species after each step (row 0 is the initial state)
+    populations = np.zeros((steps + 1, len(species_ids)), dtype=np.int32)
+    extinction_data = {}
+
+    for step_count in range(steps + 1):
+        if step_count > 0:
+            grid.step()
+        stats = grid.stats()
+        populations[step_count] = [stats[species_id] for species_id in species_ids]
+
+        # Check for extinctions
+        for species_id, count in stats.items():
+            if count == 0 and species_id not in extinction_data:
+                extinction_data[species_id] = step_count
+
+        if recorder is not None and step_count > 0:
+            recorder.record(grid.grid, step_count, extinction_data)
+        spatial_stats.update(step_count, grid.grid, wait=True)  # Exactly every interval
+    spatial_stats.close()
+    grid.close()
+    if recorder is not None:
+        recorder.close()
+
+    results = {
+        'species_ids': species_ids,
+        'populations': populations,
+        # Step at which each species went extinct, -1 if it survived
+        'extinction_steps': np.array(
+            [extinction_data.get(species_id, -1) for species_id in species_ids],
+            dtype=np.int32
+        ),
+    }
+    if output_path is not None:
+        save_results(output_path, results, grid.seed_entropy, engine)
+    return results
+
+def save_results(output_path, results, seed_entropy, engine):
+    """Write run results and the seed entropy that reproduces them to a compressed NumPy archive."""
+    np.savez_compressed(
+        output_path,
+        seed=str(seed_entropy),  # Decimal text, the entropy of unseeded runs and sweep seeds exceed 64 bits
+        engine=engine,
+        **results
+    )
@@ -0,0 +1,226 @@
+"""
+Multi-resolution population history.
+
+Samples are kept in fixed-size NumPy ring buffers at several resolutions. Level
+0 holds the most recent raw samples; every bucket of level k summarizes
+`factor` consecutive entries of level k - 1 by their minimum, maximum and mean.
+New levels are added as the run grows, so the coarsest level always reaches
+back to the first sample while memory grows only with the logarithm of the run
+length. Raw samples that drop out of level 0 can be spilled to a file.
+"""
+
+import numpy as np
+from config import STATS_HISTORY_CAPACITY, STATS_HISTORY_FACTOR, STATS_HISTORY_SPILL_PATH
+
+class _Level:
+    def __init__(self, capacity, species_count, weight):
+        """Initialize an empty ring buffer of buckets that each summarize `weight` samples."""
+        self.capacity = capacity
+        self.weight = weight
+        self.steps = np.zeros(capacity, dtype=np.int64)  # Step of the last sample in each bucket
+        self.low = np.zeros((capacity, species_count))
+        self.high = np.zeros((capacity, species_count))
+        self.mean = np.zeros((capacity, species_count))
+        self.start = 0
+        self.count = 0
+        self.evicted = False  # Whether the oldest buckets were overwritten
+
+        # Bucket being built from entries of the next finer level
+        self.pending = 0
+        self.pending_low = np.zeros(species_count)
+        self.pending_high = np.zeros(species_count)
+        self.pending_sum = np.zeros(species_count)
+
+    def push(self, step, low, high, mean):
+        """Append a bucket, overwriting the oldest one when full."""
+        index = (self.start + self.count) % self.capacity
+        if self.count == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+            self.evicted = True
+        else:
+            self.count += 1
+        self.steps[index] = step
+        self.low[index] = low
+        self.high[index] = high
+        self.mean[index] = mean
+
+    def accumulate(self, low, high, mean):
+        """Add one entry of the next finer level to the pending bucket."""
+        if self.pending == 0:
+            self.pending_low[:] = low
+            self.pending_high[:] = high
+            self.pending_sum[:] = mean
+        else:
+            np.minimum(self.pending_low, low, out=self.pending_low)
+            np.maximum(self.pending_high, high, out=self.pending_high)
+            self.pending_sum += mean
+        self.pending += 1
+
+    def order(self):
+        """Get the ring indices of the buckets from oldest to newest."""
+        return (self.start + np.arange(self.count)) % self.capacity
+
+    def oldest_step(self):
+        """Get the step of the oldest bucket, or None when empty."""
+        return int(self.steps[self.start]) if self.count else None
+
+class PopulationHistory:
+    def __init__(self, species_ids, capacity=STATS_HISTORY_CAPACITY, factor=STATS_HISTORY_FACTOR,
+                 spill_path=STATS_HISTORY_SPILL_PATH):
+        """Initialize an empty history for the given species ids."""
+        self.species_ids = sorted(species_ids)
+        self.capacity = capacity
+        self.factor = factor
+        self.spill_path = spill_path
+        self.spill_file = None
+        self.version = 0  # Incremented on every change
+        self.clear()
+
+    def clear(self):
+        """Drop all samples."""
+        self.levels = [self._new_level(0)]
+        self.first_step = None
+        self.last_step = None
+        self.version += 1
+
+    def append(self, step, stats):
+        """Record the population of every species at a step; an earlier step restarts the history."""
+        if self.last_step is not None and step < self.last_step:
+            self.clear()  # Rewound (e.g. seeking back in a replay)
+        counts = np.array([stats[species_id] for species_id in self.species_ids], dtype=np.float64)
+        if self.first_step is None:
+            self.first_step = step
+        self.last_step = step
+
+        raw = self.levels[0]
+        if raw.count == raw.capacity and self.spill_path is not None:
+            self._spill(raw.steps[raw.start:raw.start + 1], raw.mean[raw.start:raw.start + 1])
+        raw.push(step, counts, counts, counts)
+        self._feed(1, step, counts, counts, counts)
+        self.version += 1
+
+    def query(self, steps, width):
+        """Get (low, high, mean) arrays of shape (width, species) for the last `steps` steps.
+
+        Each column covers an equal share of the step range; columns without
+        samples are NaN. `steps=None` covers the whole run. The cost depends on
+        the level capacity and the width, not on the length of the run.
+        """
+        low = np.full((width, len(self.species_ids)), np.nan)
+        high = np.full_like(low, np.nan)
+        mean = np.full_like(low, np.nan)
+        if self.last_step is None or width <= 0:
+            return low, high, mean
+        end = self.last_step
+        start = self.first_step if steps is None else max(self.first_step, end - steps + 1)
+
+        entry_steps, entry_low, entry_high, entry_mean, weights = self._entries_since(start)
+        if len(entry_steps) == 0:
+            return low, high, mean
+
+        # Entries are in step order, so every column is one contiguous run of entries
+        columns = np.minimum((entry_steps - start) * width // (end - start + 1), width - 1)
+        runs = np.concatenate([[0], np.flatnonzero(np.diff(columns)) + 1])
+        columns = columns[runs]
+        low[columns] = np.minimum.reduceat(entry_low, runs)
+        high[columns] = np.maximum.reduceat(entry_high, runs)
+        mean[columns] = (
+            np.add.reduceat(entry_mean * weights[:, None], runs) / np.add.reduceat(weights, runs)[:, None]
+        )
+        return low, high, mean
+
+    def get_state(self):
+        """Get the history as JSON-compatible values."""
+        return {
+            'species_ids': self.species_ids,
+            'first_step': self.first_step,
+            'last_step': self.last_step,
+            'levels': [
+                {
+                    'steps': level.steps[level.order()].tolist(),
+                    'low': level.low[level.order()].tolist(),
+                    'high': level.high[level.order()].tolist(),
+                    'mean': level.mean[level.order()].tolist(),
+                    'evicted': level.evicted,
+                    'pending': level.pending,
+                    'pending_low': level.pending_low.tolist(),
+                    'pending_high': level.pending_high.tolist(),
+                    'pending_sum': level.pending_sum.tolist(),
+                }
+                for level in self.levels
+            ],
+        }
+
+    def set_state(self, state):
+        """Restore a history saved by get_state."""
+        self.clear()
+        self.first_step = state['first_step']
+        self.last_step = state['last_step']
+        self.levels = []
+        for depth, saved in enumerate(state['levels']):
+            level = self._new_level(depth)
+            for step, low, high, mean in zip(saved['steps'], saved['low'], saved['high'], saved['mean']):
+                level.push(step, low, high, mean)
+            level.evicted = saved['evicted']
+            level.pending = saved['pending']
+            level.pending_low[:] = saved['pending_low']
+            level.pending_high[:] = saved['pending_high']
+            level.pending_sum[:] = saved['pending_sum']
+            self.levels.append(level)
+
+    def close(self):
+        """Spill the samples still held in memory and close the spill file."""
+        if self.spill_path is None:
+            return
+        raw = self.levels[0]
+        order = raw.order()
+        self._spill(raw.steps[order], raw.mean[order])
+        self.spill_file.close()
+        self.spill_file = None
+
+    def _new_level(self, depth):
+        """Create the ring buffer of a resolution level."""
+        return _Level(self.capacity, len(self.species_ids), self.factor ** depth)
+
+    def _feed(self, depth, step, low, high, mean):
+        """Add an entry of level depth - 1 to level depth, cascading completed buckets."""
+        if depth == len(self.levels):
+            self.levels.append(self._new_level(depth))
+        level = self.levels[depth]
+        level.accumulate(low, high, mean)
+        if level.pending == self.factor:
+            bucket_mean = level.pending_sum / level.pending
+            level.pending = 0
+            level.push(step, level.pending_low, level.pending_high, bucket_mean)
+            self._feed(depth + 1, step, level.pending_low, level.pending_high, bucket_mean)
+
+    def _entries_since(self, start):
+        """Gather buckets from `start` on: the finest level reaching back to it, then finer levels for newer steps."""
+        depth = 0
+        while depth < len(self.levels) - 1 and self.levels[depth].evicted and self.levels[depth].oldest_step() > start:
+            depth += 1
+
+        parts = []
+        newest = start - 1
+        for level in reversed(self.levels[:depth + 1]):
+            order = level.order()
+            order = order[level.steps[order] > newest]
+            if len(order):
+                parts.append((
+                    level.steps[order],
+                    level.low[order],
+                    level.high[order],
+                    level.mean[order],
+                    np.full(len(order), float(level.weight))
+                ))
+                newest = int(level.steps[order[-1]])
+        if not parts:
+            return np.zeros(0, dtype=np.int64), None, None, None, None
+        return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+    def _spill(self, steps, counts):
+        """Append raw samples (step followed by the count of each species) to the spill file."""
+        if self.spill_file is None:
+            self.spill_file = open(self.spill_path, 'wb')
+        rows = np.column_stack([steps, counts]).astype(np.int64)
+        rows.tofile(self.spill_file)
@@ -0,0 +1,72 @@
+"""
+JIT-compiled grid engine for the life simulation.
+
+Runs the per-cell rules of the reference engine as a compiled loop. The random
+numbers of each step are drawn exactly as the reference engine draws them, so
+both engines produce identical runs from the same seed. Requires numba; the
+engine is only registered when it is installed. numba itself is imported when
+the first JitGrid is created, so it does not slow down launches using other
+engines.
+"""
+
+from importlib.util import find_spec
+import numpy as np
+from src.grid import Grid
+
+JIT_AVAILABLE = find_spec('numba') is not None
+_compiled_kernel = None
+
+def _step_kernel(cells, positions, species, moves, reproduces, combat_rolls, move_targets, birth_targets,
+                 win_probability, population):
+    """Process the creatures one after another, each seeing the moves made before it."""
+    for index in range(len(positions)):
+        position = positions[index]
+        species_id = species[index]
+
+        # Movement (nowhere to go beyond a wall)
+        target = move_targets[index]
+        if moves[index] and target >= 0:
+            occupant = cells[target]
+            if occupant == 0:
+                vacated_id = cells[position]
+                cells[target] = species_id
+                cells[position] = 0
+                population[species_id] += 1
+                population[vacated_id] -= 1
+            elif occupant != species_id and combat_rolls[index] < win_probability[species_id, occupant]:
+                cells[target] = species_id
+                population[species_id] += 1
+                population[occupant] -= 1
+
+        # Reproduction into the first empty neighbour in a random order
+        if reproduces[index]:
+            for direction in range(birth_targets.shape[1]):
+                target = birth_targets[index, direction]
+                if target >= 0 and cells[target] == 0:
+                    cells[target] = species_id
+                    population[species_id] += 1
+                    break
+
+def _get_kernel():
+    """Get the compiled step kernel, compiling it (or loading it from numba's cache) on first use."""
+    global _compiled_kernel
+    if _compiled_kernel is None:
+        from numba import njit
+        _compiled_kernel = njit(cache=True, nogil=True)(_step_kernel)
+    return _compiled_kernel
+
+class JitGrid(Grid):
+    def _apply_step(self, cells, positions, species, moves, reproduces, combat_rolls, move_targets, birth_targets):
+        """Process the creatures in the compiled kernel."""
+        _get_kernel()(
+            cells,
+            positions,
+            species,
+            moves,
+            reproduces,
+            np.ascontiguousarray(combat_rolls),
+            move_targets,
+            birth_targets,
+            self.win_probability,
+            self.population
+        )
@@ -0,0 +1,76 @@
+"""
+Low-overhead per-phase profiling with rolling statistics and trace export.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+import numpy as np
+from config import PROFILE_WINDOW, PROFILE_TRACE_LIMIT
+
+# Shared no-op context returned while profiling is disabled
+_DISABLED = nullcontext()
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'start')
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+    
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+
+class Profiler:
+    def __init__(self, enabled=False, window=PROFILE_WINDOW, trace_limit=PROFILE_TRACE_LIMIT):
+        """Initialize the profiler; while disabled, phases cost a single method call."""
+        self.enabled = enabled
+        self.window = window
+        self.durations = {}  # Phase name -> recent durations in seconds
+        self.trace = deque(maxlen=trace_limit)  # (name, thread id, start, end)
+        self.origin = time.perf_counter()
+    
+    def phase(self, name):
+        """Get a context manager that times one phase."""
+        if not self.enabled:
+            return _DISABLED
+        return _Phase(self, name)
+    
+    def record(self, name, start, end):
+        """Record one timed phase."""
+        durations = self.durations.get(name)
+        if durations is None:
+            durations = self.durations[name] = deque(maxlen=self.window)
+        durations.append(end - start)
+        self.trace.append((name, threading.get_ident(), start, end))
+    
+    def summary(self):
+        """Get the rolling mean and 95th percentile of every phase in milliseconds."""
+        summary = {}
+        for name, durations in list(self.durations.items()):
+            if durations:
+                values = np.array(durations) * 1000
+                summary[name] = (values.mean(), np.percentile(values, 95))
+        return summary
+    
+    def export_trace(self, path):
+        """Write recorded phases in the Chrome trace event format (chrome://tracing, Perfetto)."""
+        thread_ids = {}
+        events = []
+        for name, thread, start, end in list(self.trace):
+            events.append({
+                'name': name,
+                'ph': 'X',
+                'ts': (start - self.origin) * 1e6,
+                'dur': (end - start) * 1e6,
+                'pid': os.getpid(),
+                'tid': thread_ids.setdefault(thread, len(thread_ids)),
+            })
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
@@ -0,0 +1,224 @@
+"""
+Delta-compressed recording and replay of simulation runs.
+
+Layout of a recording file:
+    8 bytes   magic b"PLSREC01"
+    8 bytes   little-endian header length
+    header    UTF-8 JSON (grid shape and dtype, species, keyframe interval)
+    records   one per step: kind (1 byte), step (8 bytes), payload length (8 bytes), payload
+    footer    index record followed by b"PLSIDX01" and the index record offset
+
+Every step is stored as a zlib-compressed delta holding the changed cells with
+their old and new values, so it can be applied forwards and backwards.
+Keyframes with the full grid are added every `keyframe_interval` steps and
+make seeking cheap. A recording without footer (e.g. after a crash) is indexed
+by scanning the record headers.
+"""
+
+import json
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b"PLSREC01"
+INDEX_MAGIC = b"PLSIDX01"
+RECORD_HEADER = struct.Struct('<BQQ')  # kind, step, payload length
+KEYFRAME, DELTA, INDEX = 1, 2, 3
+
+class Recorder:
+    def __init__(self, path, grid, species, keyframe_interval, step=0):
+        """Open a recording and store the current grid as its first keyframe."""
+        self.file = open(path, 'wb')
+        self.keyframe_interval = keyframe_interval
+        self.previous = grid.copy()
+        self.index_dtype = np.uint32 if grid.size < 2 ** 32 else np.uint64
+        self.keyframes = []
+        self.deltas = []
+        self.first_step = step
+        self.extinction_data = {}
+
+        header = json.dumps({
+            'shape': list(grid.shape),
+            'dtype': grid.dtype.str,
+            'species': list(species.items()),
+            'keyframe_interval': keyframe_interval,
+            'first_step': step,
+        }).encode('utf-8')
+        self.file.write(MAGIC)
+        self.file.write(len(header).to_bytes(8, 'little'))
+        self.file.write(header)
+        self._write_keyframe(grid, step)
+
+    def record(self, grid, step, extinction_data=None):
+        """Append the changes that led from the previous recorded step to `grid`."""
+        cells = grid.reshape(-1)
+        previous = self.previous.reshape(-1)
+        changed = np.flatnonzero(cells != previous)
+        payload = b''.join([
+            len(changed).to_bytes(8, 'little'),
+            changed.astype(self.index_dtype).tobytes(),
+            previous[changed].tobytes(),
+            cells[changed].tobytes(),
+        ])
+        self.deltas.append(self._write_record(DELTA, step, zlib.compress(payload, 1)))
+        np.copyto(self.previous, grid)
+
+        if extinction_data:
+            self.extinction_data.update(extinction_data)
+        if step % self.keyframe_interval == 0:
+            self._write_keyframe(grid, step)
+
+    def close(self):
+        """Write the index and close the file."""
+        if self.file.closed:
+            return
+        index = json.dumps({
+            'keyframes': self.keyframes,
+            'deltas': self.deltas,
+            'extinction_data': list(self.extinction_data.items()),
+        }).encode('utf-8')
+        offset = self._write_record(INDEX, 0, zlib.compress(index))
+        self.file.write(INDEX_MAGIC)
+        self.file.write(offset.to_bytes(8, 'little'))
+        self.file.close()
+
+    def _write_keyframe(self, grid, step):
+        """Append a full copy of the grid."""
+        offset = self._write_record(KEYFRAME, step, zlib.compress(grid.tobytes(), 1))
+        self.keyframes.append([step, offset])
+
+    def _write_record(self, kind, step, payload):
+        """Append one record and return its offset."""
+        offset = self.file.tell()
+        self.file.write(RECORD_HEADER.pack(kind, step, len(payload)))
+        self.file.write(payload)
+        return offset
+
+class Replay:
+    def __init__(self, path):
+        """Open a recording and position it at its first step."""
+        self.file = open(path, 'rb')
+        if self.file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a simulation recording")
+        header_length = int.from_bytes(self.file.read(8), 'little')
+        header = json.loads(self.file.read(header_length).decode('utf-8'))
+        self.records_offset = self.file.tell()
+
+        self.shape = tuple(header['shape'])
+        self.dtype = np.dtype(header['dtype'])
+        self.index_dtype = np.uint32 if self.shape[0] * self.shape[1] < 2 ** 32 else np.uint64
+        self.species = {int(species_id): data for species_id, data in header['species']}
+        self.keyframe_interval = header['keyframe_interval']
+        self.first_step = header['first_step']
+        self._load_index()
+        self.last_step = self.first_step + len(self.deltas)
+
+        self.grid = np.zeros(self.shape, dtype=self.dtype)
+        self.population = np.zeros(max(self.species.keys()) + 1, dtype=np.int64)
+        self.step = None
+        self.seek(self.first_step)
+
+    def get_population_stats(self):
+        """Get population statistics for the current step."""
+        return {species_id: int(self.population[species_id]) for species_id in self.species.keys()}
+
+    def get_extinction_data(self):
+        """Get the extinctions that happened up to the current step."""
+        return {
+            species_id: step for species_id, step in self.extinction_data.items()
+            if step <= self.step
+        }
+
+    def seek(self, step):
+        """Jump to any recorded step via the nearest earlier keyframe."""
+        step = min(max(step, self.first_step), self.last_step)
+        keyframe_steps = [keyframe_step for keyframe_step, _ in self.keyframes]
+        position = np.searchsorted(keyframe_steps, step, side='right') - 1
+        keyframe_step, offset = self.keyframes[position]
+
+        # A nearby current step is cheaper to reach by applying deltas
+        if self.step is None or not (keyframe_step <= self.step <= step or step <= self.step < step + self.keyframe_interval):
+            _, payload = self._read_record(offset)
+            self.grid = np.frombuffer(zlib.decompress(payload), dtype=self.dtype).reshape(self.shape).copy()
+            self.population = np.bincount(self.grid.reshape(-1), minlength=len(self.population))
+            self.step = keyframe_step
+        while self.step < step:
+            self.step_forward()
+        while self.step > step:
+            self.step_backward()
+
+    def step_forward(self):
+        """Advance one step; return False at the end of the recording."""
+        if self.step >= self.last_step:
+            return False
+        self._apply_delta(self.step + 1, forward=True)
+        self.step += 1
+
+        # Recordings without index learn extinctions while playing forward
+        for species_id in self.species.keys():
+            if self.population[species_id] == 0 and species_id not in self.extinction_data:
+                self.extinction_data[species_id] = self.step
+        return True
+
+    def step_backward(self):
+        """Go back one step; return False at the start of the recording."""
+        if self.step <= self.first_step:
+            return False
+        self._apply_delta(self.step, forward=False)
+        self.step -= 1
+        return True
+
+    def close(self):
+        """Close the recording file."""
+        self.file.close()
+
+    def _apply_delta(self, step, forward):
+        """Apply the delta that leads to `step`, or undo it."""
+        _, payload = self._read_record(self.deltas[step - self.first_step - 1])
+        payload = zlib.decompress(payload)
+        count = int.from_bytes(payload[:8], 'little')
+        index_size = count * np.dtype(self.index_dtype).itemsize
+        value_size = count * self.dtype.itemsize
+        changed = np.frombuffer(payload, dtype=self.index_dtype, count=count, offset=8)
+        old = np.frombuffer(payload, dtype=self.dtype, count=count, offset=8 + index_size)
+        new = np.frombuffer(payload, dtype=self.dtype, count=count, offset=8 + index_size + value_size)
+        if not forward:
+            old, new = new, old
+
+        minlength = len(self.population)
+        self.population -= np.bincount(old, minlength=minlength)
+        self.population += np.bincount(new, minlength=minlength)
+        self.grid.reshape(-1)[changed] = new
+
+    def _read_record(self, offset):
+        """Read the record at `offset`, returning its step and payload."""
+        self.file.seek(offset)
+        _, step, length = RECORD_HEADER.unpack(self.file.read(RECORD_HEADER.size))
+        return step, self.file.read(length)
+
+    def _load_index(self):
+        """Read the index from the footer, or rebuild it by scanning the records."""
+        self.file.seek(0, 2)
+        end = self.file.tell()
+        if end >= self.records_offset + len(INDEX_MAGIC) + 8:
+            self.file.seek(end - len(INDEX_MAGIC) - 8)
+            if self.file.read(len(INDEX_MAGIC)) == INDEX_MAGIC:
+                _, payload = self._read_record(int.from_bytes(self.file.read(8), 'little'))
+                index = json.loads(zlib.decompress(payload).decode('utf-8'))
+                self.keyframes = index['keyframes']
+                self.deltas = index['deltas']
+                self.extinction_data = {int(species_id): step for species_id, step in index['extinction_data']}
+                return
+
+        self.keyframes, self.deltas, self.extinction_data = [], [], {}
+        offset = self.records_offset
+        while offset + RECORD_HEADER.size <= end:
+            self.file.seek(offset)
+            kind, step, length = RECORD_HEADER.unpack(self.file.read(RECORD_HEADER.size))
+            if offset + RECORD_HEADER.size + length > end:
+                break  # Incomplete record at the end of an interrupted recording
+            if kind == KEYFRAME:
+                self.keyframes.append([step, offset])
+            elif kind == DELTA:
+                self.deltas.append(offset)
+            offset += RECORD_HEADER.size + length
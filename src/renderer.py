@@ -6,36 +6,44 @@ import pygame
 import pygame.gfxdraw
 import numpy as np
 from config import (
-    WINDOW_SIZE, WINDOW_TITLE, GRID_SIZE, CELL_SIZE,
-    GRID_COLOR, BACKGROUND_COLOR, PANEL_COLOR,
+    WINDOW_SIZE, WINDOW_TITLE, GRID_SIZE, PANEL_COLOR,
     PANEL_BORDER_COLOR, BORDER_RADIUS, TITLE_BAR_HEIGHT,
     CONTROL_PANEL_WIDTH, STATS_UPDATE_RATE,
     STATS_FONT_SIZE, STATS_TITLE_FONT_SIZE, STATS_FONT,
-    STATS_COLOR, STATS_TITLE_COLOR, BUTTON_COLOR,
-    BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, SLIDER_COLOR,
-    SLIDER_HANDLE_COLOR, ENABLE_ANTIALIASING, SPECIES,
+    STATS_COLOR, STATS_TITLE_COLOR, ENABLE_ANTIALIASING, SPECIES,
     GRADIENT_TOP, GRADIENT_BOTTOM, PADDING, BUTTON_HEIGHT,
-    STATS_GRAPH_HEIGHT, STATS_HISTORY_LENGTH,
+    STATS_GRAPH_HEIGHT, STATS_GRAPH_STEPS,
     TOOLTIP_BACKGROUND, TOOLTIP_TEXT_COLOR, TOOLTIP_PADDING,
-    TOOLTIP_FONT_SIZE, TOOLTIP_DELAY, BUTTON_DISABLED_COLOR,
-    SLIDER_HOVER_COLOR, HOVER_TRANSITION_SPEED, SHOW_GRID,
-    EXTINCT_COLOR
+    TOOLTIP_FONT_SIZE, SHOW_GRID,
+    EXTINCT_COLOR, DIRTY_BLOCK_SIZE, PROFILE_OVERLAY_PHASES, STATS_SPECIES_LIMIT,
+    SPATIAL_STATS_PANEL
 )
 from src.ui.button import Button
 from src.ui.tooltip import Tooltip
+from src.ui.text import render_text
+from src.ui.fonts import load_font
 from src.ui.graph import PopulationGraph
+from src.history import PopulationHistory
+from src.ui.cells import CellLayer
+from src.ui.viewport import Viewport
+from src.profiler import Profiler
 
 class Renderer:
-    def __init__(self):
-        """Initialize the renderer."""
-        pygame.init()
+    def __init__(self, species=SPECIES, profiler=None, grid_size=GRID_SIZE):
+        """Initialize the renderer, opening the window."""
+        # Only the modules the window needs (pygame.init also starts audio and joysticks)
+        pygame.display.init()
+        pygame.font.init()
+        self.species = species
+        self.profiler = profiler or Profiler()
+        self.profile_text = ""  # Rolling phase timings shown in the title bar
         self.screen = pygame.display.set_mode((WINDOW_SIZE + CONTROL_PANEL_WIDTH, WINDOW_SIZE))
         pygame.display.set_caption(WINDOW_TITLE)
         
         # Initialize fonts
-        self.title_font = pygame.font.SysFont(STATS_FONT, STATS_TITLE_FONT_SIZE, bold=True)
-        self.stats_font = pygame.font.SysFont(STATS_FONT, STATS_FONT_SIZE)
-        self.tooltip_font = pygame.font.SysFont(STATS_FONT, TOOLTIP_FONT_SIZE)
+        self.title_font = load_font(STATS_FONT, STATS_TITLE_FONT_SIZE, bold=True)
+        self.stats_font = load_font(STATS_FONT, STATS_FONT_SIZE)
+        self.tooltip_font = load_font(STATS_FONT, TOOLTIP_FONT_SIZE)
         
         # Create surfaces
         self.simulation_surface = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
@@ -45,11 +53,12 @@ class Renderer:
         # Initialize UI elements
         self.frame_count = 0
         self.last_stats = {}
-        self.population_history = {species_id: [] for species_id in SPECIES.keys()}
+        self.spatial_stats = None  # Latest spatial statistics, summarized when SPATIAL_STATS_PANEL is set
+        self.population_history = PopulationHistory(self.species.keys())
         self.population_graph = PopulationGraph(
             CONTROL_PANEL_WIDTH - PADDING * 2,
             STATS_GRAPH_HEIGHT,
-            STATS_HISTORY_LENGTH
+            STATS_GRAPH_STEPS
         )
         
         # Create buttons with tooltips
@@ -71,92 +80,206 @@ class Renderer:
         
         # Grid visibility state
         self.show_grid = SHOW_GRID
+        self.cell_layer = CellLayer(self.species, self.show_grid)
+        self.viewport = Viewport(grid_size, WINDOW_SIZE)
+        self.dragging = False  # Panning the view with the mouse
         
         # Create gradient surface
         self.gradient_surface = self._create_gradient_surface()
         
+        # Dirty-region tracking: what is currently on screen
+        self.full_redraw = True
+        self.drawn_values = None  # Shown units of the grid, as sampled by the viewport
+        self.drawn_view = None  # Viewport version of drawn_values
+        self.drawn_step = None
+        self.title_state = None
+        self.panel_state = None
+        
+        # Cached control panel layers, rebuilt when the layout changes
+        self.panel_layout = None
+        self.panel_static = None
+        self.panel_offsets = None
+        self.rows_layer = None
+        self.rows_state = None
+        self.speed_layer = None
+        self.speed_state = None
+        self.tooltip_rect = None
+        
     def draw(self, grid, stats, speed, paused, step_count, extinction_data):
-        """Draw the current state of the simulation."""
-        # Draw gradient background
-        self.screen.blit(self.gradient_surface, (0, 0))
+        """Draw the parts of the frame that changed and return True if the screen was updated."""
+        full_redraw = self.full_redraw
+        self.full_redraw = False
+        dirty_rects = []
         
-        # Clear main surfaces
-        self.simulation_surface.fill(BACKGROUND_COLOR)
-        self.control_panel.fill((0, 0, 0, 0))  # Clear with transparency
-        self.title_bar.fill((0, 0, 0, 0))  # Clear with transparency
+        profiler = self.profiler
         
-        # Draw simulation elements with modern cell styling
-        self._draw_species(grid)
+        # Update population history (nothing new to record while paused)
+        if self.frame_count % STATS_UPDATE_RATE == 0 and (not paused or not self.last_stats):
+            self.last_stats = stats
+            self.population_history.append(step_count, stats)
         
-        # Update population history
+        # Refresh the profiling overlay at the stats rate so it stays readable
         if self.frame_count % STATS_UPDATE_RATE == 0:
-            self.last_stats = stats
-            for species_id, count in stats.items():
-                self.population_history[species_id].append(count)
-                if len(self.population_history[species_id]) > STATS_HISTORY_LENGTH:
-                    self.population_history[species_id].pop(0)
+            self.profile_text = self._get_profile_text()
         
-        # Draw UI elements with modern styling
-        self._draw_title_bar(paused, step_count)
-        self._draw_control_panel(stats, speed, extinction_data)
+        # Draw simulation elements only where cells changed
+        with profiler.phase("cells"):
+            cell_rects = self._get_changed_cell_rects(grid, step_count, full_redraw)
+            if cell_rects:
+                self._draw_species()
+                dirty_rects.extend(cell_rects)
         
-        # Combine surfaces with proper alpha blending
+        # Draw UI elements with modern styling when the values they show change
+        title_state = (paused, step_count, self.profile_text)
+        if full_redraw or title_state != self.title_state:
+            with profiler.phase("title_bar"):
+                self.title_state = title_state
+                self.title_bar.fill((0, 0, 0, 0))  # Clear with transparency
+                self._draw_title_bar(paused, step_count)
+                dirty_rects.append(self.title_bar.get_rect())
+        
+        panel_state = (
+            tuple(self.last_stats.items()),
+            speed,
+            tuple(extinction_data.items()),
+            self.show_grid,
+            self.population_history.version,
+            self._get_spatial_step()
+        )
+        buttons_animating = any(button.is_animating() for button in self._get_buttons())
+        if full_redraw or panel_state != self.panel_state or buttons_animating:
+            with profiler.phase("control_panel"):
+                self.panel_state = panel_state
+                self.control_panel.fill((0, 0, 0, 0))  # Clear with transparency
+                self._draw_control_panel(stats, speed, extinction_data)
+                dirty_rects.append(self.control_panel.get_rect(topleft=(WINDOW_SIZE, TITLE_BAR_HEIGHT)))
+        
+        # Tooltips are redrawn when they move or when anything beneath them was repainted
+        with profiler.phase("tooltip"):
+            mouse_pos = pygame.mouse.get_pos()
+            tooltip_text = self._get_tooltip_text(mouse_pos)
+            tooltip_rect = None
+            if tooltip_text:
+                tooltip_rect = Tooltip.get_rect(
+                    self.screen.get_size(),
+                    mouse_pos,
+                    tooltip_text,
+                    self.tooltip_font,
+                    TOOLTIP_PADDING
+                )
+            tooltip_moved = tooltip_rect != self.tooltip_rect
+            if tooltip_moved:
+                if self.tooltip_rect is not None:
+                    dirty_rects.append(self.tooltip_rect)
+                self.tooltip_rect = tooltip_rect
+            redraw_tooltip = tooltip_rect is not None and (
+                full_redraw or tooltip_moved or tooltip_rect.collidelist(dirty_rects) != -1
+            )
+            if redraw_tooltip:
+                dirty_rects.append(tooltip_rect)
+        
+        # Combine surfaces with proper alpha blending, only inside the dirty regions
+        with profiler.phase("compose"):
+            if full_redraw:
+                dirty_rects = [self.screen.get_rect()]
+            for rect in dirty_rects:
+                self._compose(rect)
+            
+            # Draw tooltips last
+            if redraw_tooltip:
+                Tooltip.draw(
+                    self.screen,
+                    mouse_pos,
+                    tooltip_text,
+                    self.tooltip_font,
+                    TOOLTIP_BACKGROUND,
+                    TOOLTIP_TEXT_COLOR,
+                    TOOLTIP_PADDING
+                )
+        
+        if dirty_rects:
+            with profiler.phase("display_update"):
+                pygame.display.update(dirty_rects)
+        self.frame_count += 1
+        return bool(dirty_rects)
+    
+    def _get_profile_text(self):
+        """Format the rolling mean and 95th percentile of the slowest phases in milliseconds."""
+        if not self.profiler.enabled:
+            return ""
+        summary = sorted(self.profiler.summary().items(), key=lambda item: item[1][0], reverse=True)
+        return "  ".join(f"{name} {mean:.1f}/{p95:.1f}" for name, (mean, p95) in summary[:PROFILE_OVERLAY_PHASES])
+    
+    def invalidate(self):
+        """Force a full repaint on the next frame (e.g. after the window was exposed)."""
+        self.full_redraw = True
+    
+    def _compose(self, rect):
+        """Rebuild one screen region from the background and UI layers."""
+        self.screen.set_clip(rect)
+        self.screen.blit(self.gradient_surface, (0, 0))
         self.screen.blit(self.title_bar, (0, 0))
         self.screen.blit(self.simulation_surface, (0, TITLE_BAR_HEIGHT))
         self.screen.blit(self.control_panel, (WINDOW_SIZE, TITLE_BAR_HEIGHT))
+        self.screen.set_clip(None)
+    
+    def _get_changed_cell_rects(self, grid, step_count, full_redraw):
+        """Get screen rectangles covering the blocks of shown units that changed since the last frame."""
+        full_rect = pygame.Rect(0, TITLE_BAR_HEIGHT, WINDOW_SIZE, WINDOW_SIZE)
+        view_changed = self.drawn_view != self.viewport.version
         
-        # Draw tooltips last
-        mouse_pos = pygame.mouse.get_pos()
-        self._handle_tooltips(mouse_pos)
+        # The grid only changes when the simulation steps
+        if not (full_redraw or view_changed) and self.drawn_values is not None and step_count == self.drawn_step:
+            return []
+        self.drawn_step = step_count
+        values = self.viewport.sample(grid)
+        if full_redraw or view_changed or self.drawn_values is None:
+            self.drawn_view = self.viewport.version
+            self.drawn_values = values
+            return [full_rect]
         
-        pygame.display.flip()
-        self.frame_count += 1
+        # Reduce changed units to changed blocks of DIRTY_BLOCK_SIZE units
+        changed = values != self.drawn_values
+        if not changed.any():
+            return []
+        self.drawn_values = values
+        rows, columns = changed.shape
+        block_rows = -(-rows // DIRTY_BLOCK_SIZE)
+        block_columns = -(-columns // DIRTY_BLOCK_SIZE)
+        padded = np.zeros((block_rows * DIRTY_BLOCK_SIZE, block_columns * DIRTY_BLOCK_SIZE), dtype=bool)
+        padded[:rows, :columns] = changed
+        blocks = padded.reshape(block_rows, DIRTY_BLOCK_SIZE, block_columns, DIRTY_BLOCK_SIZE).any(axis=(1, 3))
+        
+        # Updating many small rectangles costs more than one large one
+        if blocks.mean() > 0.5:
+            return [full_rect]
+        
+        # Merge horizontal runs of changed blocks into one rectangle each
+        _, (x, y) = self.viewport.get_window()
+        block_pixels = DIRTY_BLOCK_SIZE * self.viewport.unit_pixels
+        rects = []
+        for row in np.flatnonzero(blocks.any(axis=1)):
+            edges = np.flatnonzero(np.diff(np.concatenate(([False], blocks[row], [False]))))
+            for start, end in zip(edges[::2], edges[1::2]):
+                rect = pygame.Rect(
+                    x + start * block_pixels,
+                    TITLE_BAR_HEIGHT + y + row * block_pixels,
+                    (end - start) * block_pixels,
+                    block_pixels
+                )
+                rects.append(rect.clip(full_rect))
+        return rects
     
     def _create_gradient_surface(self):
-        """Create a vertical gradient surface for the background."""
-        surface = pygame.Surface((WINDOW_SIZE + CONTROL_PANEL_WIDTH, WINDOW_SIZE))
-        for y in range(WINDOW_SIZE):
-            progress = y / WINDOW_SIZE
-            color = [
-                int(GRADIENT_TOP[i] * (1 - progress) + GRADIENT_BOTTOM[i] * progress)
-                for i in range(3)
-            ]
-            pygame.draw.line(surface, color, (0, y), (WINDOW_SIZE + CONTROL_PANEL_WIDTH, y))
-        return surface
+        """Create a vertical gradient surface for the background from one array of row colors."""
+        progress = (np.arange(WINDOW_SIZE) / WINDOW_SIZE)[:, None]
+        colors = (np.array(GRADIENT_TOP) * (1 - progress) + np.array(GRADIENT_BOTTOM) * progress).astype(np.uint8)
+        pixels = np.broadcast_to(colors, (WINDOW_SIZE + CONTROL_PANEL_WIDTH, WINDOW_SIZE, 3))
+        return pygame.surfarray.make_surface(pixels)
     
-    def _draw_species(self, grid):
-        """Draw all species on the grid with modern styling."""
-        # Draw grid lines if enabled
-        if self.show_grid:
-            for x in range(GRID_SIZE + 1):
-                pygame.draw.line(
-                    self.simulation_surface,
-                    GRID_COLOR,
-                    (x * CELL_SIZE, 0),
-                    (x * CELL_SIZE, WINDOW_SIZE)
-                )
-                pygame.draw.line(
-                    self.simulation_surface,
-                    GRID_COLOR,
-                    (0, x * CELL_SIZE),
-                    (WINDOW_SIZE, x * CELL_SIZE)
-                )
-
-        for x in range(GRID_SIZE):
-            for y in range(GRID_SIZE):
-                species_id = grid[x, y]
-                if species_id != 0:
-                    color = SPECIES[species_id]['color']
-                    rect = pygame.Rect(
-                        y * CELL_SIZE + (1 if self.show_grid else 0),
-                        x * CELL_SIZE + (1 if self.show_grid else 0),
-                        CELL_SIZE - (2 if self.show_grid else 0),
-                        CELL_SIZE - (2 if self.show_grid else 0)
-                    )
-                    if ENABLE_ANTIALIASING and CELL_SIZE > 4:
-                        self._draw_rounded_rect(self.simulation_surface, rect, color)
-                    else:
-                        pygame.draw.rect(self.simulation_surface, color, rect)
+    def _draw_species(self):
+        """Draw the species in view with a single array blit."""
+        self.cell_layer.draw(self.simulation_surface, self.drawn_values, self.viewport)
     
     def _draw_title_bar(self, paused, step_count):
         """Draw the title bar with modern styling."""
@@ -169,9 +292,17 @@ class Renderer:
         
         # Draw title with step count (removed dash)
         title_text = f"{WINDOW_TITLE} {'(Paused)' if paused else ''} Step: {step_count:,}"
-        title = self.title_font.render(title_text, True, STATS_TITLE_COLOR)
+        title = render_text(self.title_font, title_text, STATS_TITLE_COLOR)
         self.title_bar.blit(title, (PADDING, (TITLE_BAR_HEIGHT - title.get_height()) // 2))
         
+        # Draw the profiling overlay right-aligned
+        if self.profile_text:
+            profile = render_text(self.stats_font, self.profile_text, STATS_COLOR)
+            self.title_bar.blit(profile, (
+                WINDOW_SIZE + CONTROL_PANEL_WIDTH - PADDING - profile.get_width(),
+                (TITLE_BAR_HEIGHT - profile.get_height()) // 2
+            ))
+        
         # Draw subtle bottom border
         pygame.draw.line(
             self.title_bar,
@@ -181,68 +312,45 @@ class Renderer:
         )
     
     def _draw_control_panel(self, stats, speed, extinction_data):
-        """Draw the control panel with modern styling."""
-        # Draw panel background with rounded corners
-        panel_rect = pygame.Rect(0, 0, CONTROL_PANEL_WIDTH, WINDOW_SIZE)
-        pygame.draw.rect(self.control_panel, PANEL_COLOR, panel_rect, border_radius=BORDER_RADIUS)
-        
-        y_offset = PADDING
+        """Composite the control panel from its cached layers."""
+        listed_stats = self._get_listed_stats()
+        unlisted = len(self.last_stats) - len(listed_stats)
+        spatial_rows = 2 if self._get_spatial_step() is not None else 0
+        layout = (bool(self.last_stats), len(listed_stats) + (1 if unlisted else 0) + spatial_rows)
+        if layout != self.panel_layout:
+            self.panel_layout = layout
+            self._create_panel_layers(*layout)
         
-        # Draw statistics section
-        stats_title = self.title_font.render("Statistics", True, STATS_TITLE_COLOR)
-        self.control_panel.blit(stats_title, (PADDING, y_offset))
-        y_offset += stats_title.get_height() + PADDING
+        # Static chrome first, copied exactly (the panel itself is translucent)
+        self.control_panel.blit(self.panel_static, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
         
-        # Draw population graph
+        # Population graph (re-rasterized only when new history arrives)
         if self.last_stats:
             self.population_graph.draw(
                 self.control_panel,
-                (PADDING, y_offset),
+                (PADDING, self.panel_offsets['graph']),
                 self.population_history,
-                SPECIES
+                self.species
             )
-            y_offset += STATS_GRAPH_HEIGHT + PADDING
             
-            # Draw species statistics with modern indicators
-            for species_id, count in self.last_stats.items():
-                species_data = SPECIES[species_id]
-                
-                # Draw species indicator with gradient
-                indicator_rect = pygame.Rect(PADDING, y_offset, 12, 12)
-                self._draw_rounded_rect(
-                    self.control_panel,
-                    indicator_rect,
-                    species_data['color']
-                )
-                
-                # Draw species name and count
-                text = f"{species_data['name']}: {count:,}"
-                if count == 0:
-                    extinction_step = extinction_data.get(species_id, 0)
-                    # Show extinction info on the same line
-                    text += f" (†{extinction_step:,})"
-                    text_surface = self.stats_font.render(text, True, EXTINCT_COLOR)
-                    self.control_panel.blit(text_surface, (PADDING + 20, y_offset))
-                else:
-                    text_surface = self.stats_font.render(text, True, STATS_COLOR)
-                    self.control_panel.blit(text_surface, (PADDING + 20, y_offset))
-                
-                y_offset += text_surface.get_height() + PADDING
-        
-        y_offset += PADDING
+            # Species rows, redrawn only when the values they show change
+            rows_state = (tuple(self.last_stats.items()), tuple(extinction_data.items()), self._get_spatial_step())
+            if rows_state != self.rows_state:
+                self.rows_state = rows_state
+                self._draw_species_rows(listed_stats, unlisted, extinction_data)
+            self._replace(self.rows_layer, (0, self.panel_offsets['rows']))
         
-        # Draw speed control section
-        speed_title = self.title_font.render("Controls", True, STATS_TITLE_COLOR)
-        self.control_panel.blit(speed_title, (PADDING, y_offset))
-        y_offset += speed_title.get_height() + PADDING // 2
-        
-        # Speed indicator with modern styling
-        speed_text = f"Current Speed: {speed:.2f}x"
-        speed_surface = self.stats_font.render(speed_text, True, STATS_COLOR)
-        self.control_panel.blit(speed_surface, (PADDING, y_offset))
-        y_offset += speed_surface.get_height() + PADDING
+        # Speed indicator with modern styling (speed is in steps per second, None is turbo)
+        if speed != self.speed_state:
+            self.speed_state = speed
+            self.speed_layer = self._crop_static(self.panel_offsets['speed'], self.stats_font.get_linesize())
+            speed_text = "Current Speed: Turbo" if speed is None else f"Current Speed: {speed:,} steps/s"
+            speed_surface = render_text(self.stats_font, speed_text, STATS_COLOR)
+            self.speed_layer.blit(speed_surface, (PADDING, 0))
+        self._replace(self.speed_layer, (0, self.panel_offsets['speed']))
         
         # Draw speed control buttons
+        y_offset = self.panel_offsets['buttons']
         button_width = CONTROL_PANEL_WIDTH - PADDING * 2
         self.slower_button.draw(
             self.control_panel,
@@ -268,26 +376,136 @@ class Renderer:
             button_width
         )
     
-    def _handle_tooltips(self, mouse_pos):
-        """Handle tooltip rendering for UI elements."""
+    def _get_listed_stats(self):
+        """Get the species rows shown in the panel (the largest populations when there are many)."""
+        listed_stats = list(self.last_stats.items())
+        if len(listed_stats) > STATS_SPECIES_LIMIT:
+            listed_stats.sort(key=lambda item: item[1], reverse=True)
+            listed_stats = listed_stats[:STATS_SPECIES_LIMIT - 1]
+        return listed_stats
+    
+    def _create_panel_layers(self, show_stats, row_count):
+        """Render the static panel chrome and lay out the sections for a number of species rows."""
+        self.panel_static = pygame.Surface((CONTROL_PANEL_WIDTH, WINDOW_SIZE), pygame.SRCALPHA)
+        self.panel_offsets = {}
+        
+        # Draw panel background with rounded corners
+        panel_rect = pygame.Rect(0, 0, CONTROL_PANEL_WIDTH, WINDOW_SIZE)
+        pygame.draw.rect(self.panel_static, PANEL_COLOR, panel_rect, border_radius=BORDER_RADIUS)
+        
+        y_offset = PADDING
+        
+        # Draw statistics section
+        stats_title = render_text(self.title_font, "Statistics", STATS_TITLE_COLOR)
+        self.panel_static.blit(stats_title, (PADDING, y_offset))
+        y_offset += stats_title.get_height() + PADDING
+        
+        # Room for the population graph and the species rows
+        if show_stats:
+            self.panel_offsets['graph'] = y_offset
+            y_offset += STATS_GRAPH_HEIGHT + PADDING
+            self.panel_offsets['rows'] = y_offset
+            y_offset += row_count * (self.stats_font.get_linesize() + PADDING)
+        
+        y_offset += PADDING
+        
+        # Draw speed control section
+        speed_title = render_text(self.title_font, "Controls", STATS_TITLE_COLOR)
+        self.panel_static.blit(speed_title, (PADDING, y_offset))
+        y_offset += speed_title.get_height() + PADDING // 2
+        self.panel_offsets['speed'] = y_offset
+        y_offset += self.stats_font.get_linesize() + PADDING
+        self.panel_offsets['buttons'] = y_offset
+        
+        # Layers on top of the chrome are rebuilt for the new layout
+        self.rows_state = None
+        self.speed_state = object()  # Never equal to a speed, including None (turbo)
+        if show_stats:
+            self.rows_layer = self._crop_static(self.panel_offsets['rows'], y_offset - self.panel_offsets['rows'])
+    
+    def _draw_species_rows(self, listed_stats, unlisted, extinction_data):
+        """Draw species statistics with modern indicators onto the rows layer."""
+        self.rows_layer = self._crop_static(self.panel_offsets['rows'], self.rows_layer.get_height())
+        y_offset = 0
+        for species_id, count in listed_stats:
+            species_data = self.species[species_id]
+            
+            # Draw species indicator with gradient
+            indicator_rect = pygame.Rect(PADDING, y_offset, 12, 12)
+            self._draw_rounded_rect(
+                self.rows_layer,
+                indicator_rect,
+                species_data['color']
+            )
+            
+            # Draw species name and count
+            text = f"{species_data['name']}: {count:,}"
+            if count == 0:
+                extinction_step = extinction_data.get(species_id, 0)
+                # Show extinction info on the same line
+                text += f" (†{extinction_step:,})"
+                text_surface = render_text(self.stats_font, text, EXTINCT_COLOR)
+                self.rows_layer.blit(text_surface, (PADDING + 20, y_offset))
+            else:
+                text_surface = render_text(self.stats_font, text, STATS_COLOR)
+                self.rows_layer.blit(text_surface, (PADDING + 20, y_offset))
+            
+            y_offset += self.stats_font.get_linesize() + PADDING  # Fixed row height keeps the layout stable
+        
+        if unlisted:
+            alive = sum(1 for species_id, count in self.last_stats.items() if count > 0)
+            text_surface = render_text(
+                self.stats_font,
+                f"+{unlisted:,} more species ({alive:,} alive in total)",
+                STATS_COLOR
+            )
+            self.rows_layer.blit(text_surface, (PADDING + 20, y_offset))
+            y_offset += self.stats_font.get_linesize() + PADDING
+        
+        # Summary of the latest spatial statistics, over all species
+        if self._get_spatial_step() is not None:
+            species_stats = self.spatial_stats['species'].values()
+            clusters = sum(stats['clusters'] for stats in species_stats)
+            largest = max((stats['largest_cluster'] for stats in species_stats), default=0)
+            for text in (
+                f"Clusters: {clusters:,} (largest {largest:,})",
+                f"Front length: {self.spatial_stats['front_length']:,}"
+            ):
+                text_surface = render_text(self.stats_font, text, STATS_COLOR)
+                self.rows_layer.blit(text_surface, (PADDING, y_offset))
+                y_offset += self.stats_font.get_linesize() + PADDING
+    
+    def _get_spatial_step(self):
+        """Get the step of the spatial statistics shown in the panel, None if there are none to show."""
+        if not SPATIAL_STATS_PANEL or self.spatial_stats is None:
+            return None
+        return self.spatial_stats['step']
+    
+    def _crop_static(self, y, height):
+        """Copy a full-width band of the static panel chrome to draw a layer on."""
+        height = max(0, min(height, WINDOW_SIZE - y))
+        return self.panel_static.subsurface((0, y, CONTROL_PANEL_WIDTH, height)).copy()
+    
+    def _replace(self, layer, pos):
+        """Replace a region of the control panel with a layer, including its alpha."""
+        rect = layer.get_rect(topleft=pos)
+        self.control_panel.fill((0, 0, 0, 0), rect)
+        self.control_panel.blit(layer, rect, special_flags=pygame.BLEND_RGBA_ADD)
+    
+    def _get_tooltip_text(self, mouse_pos):
+        """Get the tooltip text of the UI element under the mouse, if any."""
         x = mouse_pos[0] - WINDOW_SIZE
         y = mouse_pos[1] - TITLE_BAR_HEIGHT
         
         # Check button tooltips
-        for button in [self.slower_button, self.faster_button, self.grid_button]:
+        for button in self._get_buttons():
             if button.is_hovered((x, y)):
-                tooltip_text = button.get_tooltip()
-                if tooltip_text:
-                    Tooltip.draw(
-                        self.screen,
-                        mouse_pos,
-                        tooltip_text,
-                        self.tooltip_font,
-                        TOOLTIP_BACKGROUND,
-                        TOOLTIP_TEXT_COLOR,
-                        TOOLTIP_PADDING
-                    )
-                break
+                return button.get_tooltip()
+        return None
+    
+    def _get_buttons(self):
+        """Get all buttons in the control panel."""
+        return [self.slower_button, self.faster_button, self.grid_button]
     
     def handle_click(self, pos):
         """Handle clicks on UI elements."""
@@ -301,10 +519,44 @@ class Renderer:
             return "faster"
         elif self.grid_button.is_clicked(click_pos):
             self.show_grid = not self.show_grid
+            self.cell_layer.set_show_grid(self.show_grid)
+            self.drawn_values = None  # Repaint every cell with the new styling
             return "toggle_grid"
         
         return None
     
+    def handle_view_event(self, event):
+        """Zoom and pan the world view; return True if the event was used.
+        
+        The mouse wheel zooms at the cursor, dragging with the left button pans,
+        +/- zoom at the centre and F fits the whole world in view.
+        """
+        viewport = self.viewport
+        if event.type == pygame.MOUSEWHEEL:
+            mouse_pos = pygame.mouse.get_pos()
+            if not self._in_view(mouse_pos):
+                return False
+            viewport.zoom(event.y, (mouse_pos[0], mouse_pos[1] - TITLE_BAR_HEIGHT))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self._in_view(event.pos):
+            self.dragging = True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.dragging:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            viewport.pan(*event.rel)
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+            viewport.zoom(1)
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            viewport.zoom(-1)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+            viewport.fit()
+        else:
+            return False
+        return True
+    
+    def _in_view(self, pos):
+        """Check if a screen position is over the world view."""
+        return pos[0] < WINDOW_SIZE and pos[1] >= TITLE_BAR_HEIGHT
+    
     def _draw_rounded_rect(self, surface, rect, color):
         """Draw a rounded rectangle with anti-aliasing and optional gradient."""
         if ENABLE_ANTIALIASING:
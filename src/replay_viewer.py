@@ -0,0 +1,110 @@
+"""
+Replay of recorded runs in the simulation window.
+"""
+
+import pygame
+from config import FRAME_RATE, IDLE_FRAME_RATE, WINDOW_SIZE, SPEED_LEVELS, DEFAULT_SPEED_LEVEL
+from src.recording import Replay
+from src.renderer import Renderer
+from src.scheduler import StepScheduler
+
+class ReplayViewer:
+    def __init__(self, path):
+        """Initialize the viewer for a recording file."""
+        self.replay = Replay(path)
+        self.renderer = Renderer(self.replay.species, grid_size=len(self.replay.grid))
+        self.clock = pygame.time.Clock()
+        self.paused = False
+        self.reverse = False  # Play backwards
+        self.speed_level = DEFAULT_SPEED_LEVEL  # Index into SPEED_LEVELS
+        self.scheduler = StepScheduler(SPEED_LEVELS[self.speed_level])
+    
+    def run(self):
+        """Run the playback loop.
+        
+        Space pauses, R reverses the direction, Left/Right step one frame,
+        Page Up/Down jump one keyframe interval, Home/End seek to the ends and
+        number keys 0-9 seek to 0%-90% of the recording.
+        """
+        running = True
+        elapsed = 0.0
+        while running:
+            # Handle events
+            for event in pygame.event.get():
+                if self.renderer.handle_view_event(event):
+                    continue  # Zooming and panning the world view
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    running = self._handle_key(event.key)
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    if event.button == 1:  # Left click
+                        self._handle_click(event.pos)
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.renderer.invalidate()
+            
+            # Play at the selected speed; decoding is the only cost
+            if not self.paused:
+                steps = self.scheduler.steps_due(elapsed) if not self.scheduler.turbo else self.replay.keyframe_interval
+                for _ in range(steps):
+                    moved = self.replay.step_backward() if self.reverse else self.replay.step_forward()
+                    if not moved:
+                        self.paused = True  # Stop at either end of the recording
+                        break
+            
+            screen_updated = self.renderer.draw(
+                self.replay.grid,
+                self.replay.get_population_stats(),
+                self.scheduler.steps_per_second,
+                self.paused,
+                self.replay.step,
+                self.replay.get_extinction_data()
+            )
+            
+            if self.paused and not screen_updated:
+                elapsed = self.clock.tick(IDLE_FRAME_RATE) / 1000
+            else:
+                elapsed = self.clock.tick(FRAME_RATE) / 1000
+        
+        self.replay.close()
+        self.renderer.population_history.close()
+        pygame.quit()
+    
+    def _handle_key(self, key):
+        """Handle playback keys; return False to quit."""
+        replay = self.replay
+        if key == pygame.K_ESCAPE:
+            return False
+        elif key == pygame.K_SPACE:
+            self.paused = not self.paused
+            self.scheduler.reset()
+        elif key == pygame.K_r:
+            self.reverse = not self.reverse
+        elif key == pygame.K_RIGHT:
+            replay.step_forward()
+        elif key == pygame.K_LEFT:
+            replay.step_backward()
+        elif key == pygame.K_PAGEUP:
+            replay.seek(replay.step + replay.keyframe_interval)
+        elif key == pygame.K_PAGEDOWN:
+            replay.seek(replay.step - replay.keyframe_interval)
+        elif key == pygame.K_HOME:
+            replay.seek(replay.first_step)
+        elif key == pygame.K_END:
+            replay.seek(replay.last_step)
+        elif pygame.K_0 <= key <= pygame.K_9:
+            fraction = (key - pygame.K_0) / 10
+            replay.seek(replay.first_step + int((replay.last_step - replay.first_step) * fraction))
+        return True
+    
+    def _handle_click(self, pos):
+        """Handle mouse clicks on UI elements."""
+        # Check if click is in control panel
+        if pos[0] > WINDOW_SIZE:
+            action = self.renderer.handle_click(pos)
+            if action == "slower":
+                self.speed_level = max(0, self.speed_level - 1)
+                self.scheduler.set_rate(SPEED_LEVELS[self.speed_level])
+            elif action == "faster":
+                self.speed_level = min(len(SPEED_LEVELS) - 1, self.speed_level + 1)
+                self.scheduler.set_rate(SPEED_LEVELS[self.speed_level])
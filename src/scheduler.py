@@ -0,0 +1,36 @@
+"""
+Fixed-timestep scheduling of simulation steps independent of the frame rate.
+"""
+
+class StepScheduler:
+    def __init__(self, steps_per_second, max_catch_up=0.25):
+        """Initialize the scheduler; steps_per_second None means turbo (uncapped)."""
+        self.steps_per_second = steps_per_second
+        self.max_catch_up = max_catch_up  # Seconds of missed steps that may be made up
+        self.accumulator = 0.0
+    
+    @property
+    def turbo(self):
+        """Check if steps are uncapped."""
+        return self.steps_per_second is None
+    
+    def set_rate(self, steps_per_second):
+        """Change the step rate without carrying over steps owed at the old rate."""
+        self.steps_per_second = steps_per_second
+        self.reset()
+    
+    def reset(self):
+        """Forget owed steps, e.g. after a pause."""
+        self.accumulator = 0.0
+    
+    def steps_due(self, elapsed):
+        """Get the number of steps owed after `elapsed` seconds of wall time."""
+        if self.turbo:
+            return 0
+        self.accumulator += elapsed * self.steps_per_second
+        
+        # Drop backlog beyond the catch-up limit instead of spiralling behind
+        self.accumulator = min(self.accumulator, max(1.0, self.steps_per_second * self.max_catch_up))
+        steps = int(self.accumulator)
+        self.accumulator -= steps
+        return steps
@@ -3,67 +3,138 @@ Main simulation module for the life simulation.
 """
 
 import pygame
-from config import FRAME_RATE, WINDOW_SIZE, CONTROL_PANEL_WIDTH, TITLE_BAR_HEIGHT
-from src.grid import Grid
+from config import (
+    ENGINE, FRAME_RATE, IDLE_FRAME_RATE, WINDOW_SIZE, CONTROL_PANEL_WIDTH, TITLE_BAR_HEIGHT,
+    SPEED_LEVELS, DEFAULT_SPEED_LEVEL, STEP_TIME_BUDGET, BACKGROUND_STEPPING,
+    CHECKPOINT_PATH, AUTOSAVE_INTERVAL, RECORD_KEYFRAME_INTERVAL,
+    ENABLE_PROFILING, PROFILE_TRACE_PATH, GRID_SIZE, SPATIAL_STATS_INTERVAL, SPATIAL_STATS_PATH
+)
+from src.checkpoint import Autosaver, read_checkpoint, restore_grid, save_checkpoint
+from src.engines import create_grid
+from src.profiler import Profiler
+from src.recording import Recorder
 from src.renderer import Renderer
+from src.spatial import SpatialStatsRecorder
+from src.worker import SimulationWorker
 
 class Simulation:
-    def __init__(self):
-        """Initialize the simulation."""
-        pygame.init()
-        pygame.font.init()
-        
-        self.grid = Grid()
-        self.renderer = Renderer()
+    def __init__(self, engine=ENGINE, seed=None, background=BACKGROUND_STEPPING, checkpoint=None, record=None,
+                 profile=ENABLE_PROFILING, size=GRID_SIZE, spatial_interval=SPATIAL_STATS_INTERVAL):
+        """Initialize the simulation, optionally restoring it from a checkpoint file and recording it."""
+        header = None
+        if checkpoint is not None:
+            grid, header = read_checkpoint(checkpoint)
+            engine = header['engine']
+            self.grid = restore_grid(grid, header)
+        else:
+            self.grid = create_grid(engine, seed, size=size)
+        self.engine = engine
+        self.profiler = Profiler(profile)  # Shared by the loop, the worker and the renderer
+        self.renderer = Renderer(self.grid.species, self.profiler, len(self.grid.grid))
         self.clock = pygame.time.Clock()
         self.paused = False
-        self.simulation_speed = 1.0  # Speed multiplier
-        self.step_count = 0  # Step counter
-        self.extinction_data = {}  # Track when species go extinct
+        self.speed_level = DEFAULT_SPEED_LEVEL  # Index into SPEED_LEVELS
+        self.worker = SimulationWorker(self.grid, SPEED_LEVELS[self.speed_level], self.profiler)
+        self.background = background  # Step on a worker thread instead of between frames
+        self.autosaver = Autosaver(CHECKPOINT_PATH, AUTOSAVE_INTERVAL)
+        self.spatial_stats = SpatialStatsRecorder(
+            SPATIAL_STATS_PATH, spatial_interval, self.grid.topology, self.grid.species.keys()
+        )
+        
+        if header is not None:
+            self.worker.step_count = header['step_count']
+            self.worker.extinction_data = header['extinction_data']
+            self.renderer.population_history.set_state(header['population_history'])
+            self.autosaver.last_step = header['step_count']
+        
+        if record is not None:
+            self.worker.recorder = Recorder(
+                record,
+                self.grid.grid,
+                self.grid.species,
+                RECORD_KEYFRAME_INTERVAL,
+                self.worker.step_count
+            )
+    
+    @property
+    def step_count(self):
+        """Get the number of steps simulated so far."""
+        return self.worker.step_count
+    
+    @property
+    def extinction_data(self):
+        """Get the step at which each extinct species died out."""
+        return self.worker.extinction_data
     
     def run(self):
         """Run the main simulation loop."""
+        if self.background:
+            self.worker.start()
+        
+        profiler = self.profiler
         running = True
+        elapsed = 0.0
         while running:
             # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+            with profiler.phase("events"):
+                for event in pygame.event.get():
+                    if self.renderer.handle_view_event(event):
+                        continue  # Zooming and panning the world view
+                    if event.type == pygame.QUIT:
                         running = False
-                    elif event.key == pygame.K_SPACE:
-                        self.paused = not self.paused
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
-                        self._handle_click(event.pos)
-            
-            # Update simulation state if not paused
-            if not self.paused:
-                self.grid.update()
-                self.step_count += 1
+                    elif event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            running = False
+                        elif event.key == pygame.K_SPACE:
+                            self.paused = not self.paused
+                            self.worker.set_paused(self.paused)
+                        elif event.key == pygame.K_s:
+                            save_checkpoint(CHECKPOINT_PATH, self)
+                        elif event.key == pygame.K_p:
+                            profiler.enabled = not profiler.enabled
+                        elif event.key == pygame.K_t:
+                            profiler.export_trace(PROFILE_TRACE_PATH)
+                    elif event.type == pygame.MOUSEBUTTONDOWN:
+                        if event.button == 1:  # Left click
+                            self._handle_click(event.pos)
+                    elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                        self.renderer.invalidate()
             
-            # Get current statistics
-            stats = self.grid.get_population_stats()
+            # Update simulation state if not paused (any number of steps per frame)
+            if not self.paused and not self.background:
+                self.worker.advance(elapsed, STEP_TIME_BUDGET / FRAME_RATE)
+            self.autosaver.update(self)
             
-            # Check for extinctions
-            for species_id, count in stats.items():
-                if count == 0 and species_id not in self.extinction_data:
-                    self.extinction_data[species_id] = self.step_count
-            
-            # Render current state
-            self.renderer.draw(
-                self.grid.grid,
-                stats,
-                self.simulation_speed,
-                self.paused,
-                self.step_count,
-                self.extinction_data
-            )
+            # Render the latest complete state (only the regions that changed)
+            with profiler.phase("draw"), self.worker.snapshot() as snapshot:
+                self.spatial_stats.update(snapshot.step_count, snapshot.grid)
+                self.renderer.spatial_stats = self.spatial_stats.latest
+                screen_updated = self.renderer.draw(
+                    snapshot.grid,
+                    snapshot.stats,
+                    self.worker.scheduler.steps_per_second,
+                    self.paused,
+                    snapshot.step_count,
+                    snapshot.extinction_data
+                )
             
-            # Control frame rate with speed multiplier
-            self.clock.tick(FRAME_RATE * self.simulation_speed)
+            # Keep a steady frame rate regardless of the step rate, idling while nothing changes
+            if self.paused and not screen_updated:
+                elapsed = self.clock.tick(IDLE_FRAME_RATE) / 1000
+            else:
+                elapsed = self.clock.tick(FRAME_RATE) / 1000
         
+        self.worker.stop()
+        self.autosaver.finish()
+        self.spatial_stats.close()
+        if AUTOSAVE_INTERVAL:
+            save_checkpoint(CHECKPOINT_PATH, self)  # Keep the final state of the run
+        if self.worker.recorder is not None:
+            self.worker.recorder.close()
+        self.renderer.population_history.close()
+        if profiler.trace:
+            profiler.export_trace(PROFILE_TRACE_PATH)  # Keep the timings of a profiled run
+        self.grid.close()
         pygame.quit()
     
     def _handle_click(self, pos):
@@ -72,9 +143,11 @@ class Simulation:
         if pos[0] > WINDOW_SIZE:
             action = self.renderer.handle_click(pos)
             if action == "slower":
-                self.simulation_speed = max(0.25, self.simulation_speed - 0.25)
+                self.speed_level = max(0, self.speed_level - 1)
+                self.worker.set_rate(SPEED_LEVELS[self.speed_level])
             elif action == "faster":
-                self.simulation_speed = min(4.0, self.simulation_speed + 0.25)
+                self.speed_level = min(len(SPEED_LEVELS) - 1, self.speed_level + 1)
+                self.worker.set_rate(SPEED_LEVELS[self.speed_level])
             # No need to handle "toggle_grid" as it's handled internally by the renderer
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+"""
+Sparse agent-list grid engine for the life simulation.
+"""
+
+import numpy as np
+from config import GRID_SIZE
+from src.vector_grid import VectorGrid
+
+class SparseGrid(VectorGrid):
+    def __init__(self, seed=None, species=None, size=GRID_SIZE):
+        """Initialize the grid and index its occupied cells by species."""
+        super().__init__(seed, species, size)
+        cells = self.grid.reshape(-1)
+        positions = np.flatnonzero(cells)
+        self._index_agents(positions, cells[positions])
+
+    def step(self):
+        """Update the grid state for one simulation step."""
+        cells = self.grid.reshape(-1)  # Flat view, written in place
+        positions = np.concatenate(list(self.agents.values()))
+        positions = self._step(cells, positions)
+        self._index_agents(positions, cells[positions])
+
+    def set_state(self, grid, state):
+        """Restore the cells and the engine state, then rebuild the index."""
+        super().set_state(grid, state)
+        cells = self.grid.reshape(-1)
+        positions = np.flatnonzero(cells)
+        self._index_agents(positions, cells[positions])
+
+    def _index_agents(self, positions, species):
+        """Store occupied flat cell indices as one compact array per species."""
+        # Sorted by cell within each species, so the index only depends on the grid
+        order = np.lexsort((positions, species))
+        positions, species = positions[order], species[order]
+        species_ids = np.array(list(self.species.keys()))
+        starts = np.searchsorted(species, species_ids, side='left')
+        ends = np.searchsorted(species, species_ids, side='right')
+        self.agents = {
+            species_id: positions[start:end]
+            for species_id, start, end in zip(self.species.keys(), starts, ends)
+        }
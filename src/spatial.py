@@ -0,0 +1,199 @@
+"""
+Spatial statistics of the simulation world.
+
+Every statistic is computed from a copy of the cells with whole-array
+operations over the grid's topology (the same neighbours creatures move to):
+
+    clusters           connected groups of cells of one species: their number,
+                       the largest and the mean size
+    contacts           neighbouring pairs of this species and another species
+    front_length       neighbouring pairs of different species in total
+    density_histogram  how many windows of SPATIAL_DENSITY_WINDOW cells hold
+                       each share of this species, in SPATIAL_DENSITY_BINS bins
+    centroid           mean (row, column) of the species, a circular mean on
+                       wrapped worlds; None when extinct
+
+Connected components use scipy.sparse.csgraph when scipy is installed and a
+NumPy union-find otherwise. SpatialStatsRecorder computes the statistics every
+K steps on a background thread and appends them to a JSON lines file.
+"""
+
+import json
+import threading
+from importlib.util import find_spec
+import numpy as np
+from config import SPATIAL_DENSITY_WINDOW, SPATIAL_DENSITY_BINS
+
+SCIPY_AVAILABLE = find_spec('scipy') is not None
+
+def compute_spatial_stats(cells, species_ids, topology):
+    """Compute the spatial statistics of every species in a grid of cells."""
+    flat = cells.reshape(-1)
+    positions = np.flatnonzero(flat).astype(topology.index_dtype)
+    species = flat[positions].astype(np.int64)
+    size = int(max(species_ids)) + 1
+
+    # Every occupied cell with each of its neighbours
+    neighbours = topology.neighbours(positions[:, None], np.arange(topology.degree))
+    sources = np.broadcast_to(np.arange(len(positions))[:, None], neighbours.shape)
+    inside = neighbours >= 0
+    sources = sources[inside]
+    neighbour_species = flat[neighbours[inside]].astype(np.int64)
+    source_species = species[sources]
+    same = neighbour_species == source_species
+    contact = (neighbour_species != 0) & ~same
+
+    # Clusters: components of the graph of same-species neighbours
+    nodes = np.full(flat.shape, -1, dtype=np.int64)
+    nodes[positions] = np.arange(len(positions))
+    labels = _connected_components(len(positions), sources[same], nodes[neighbours[inside][same]])
+    component_count = int(labels.max()) + 1 if len(labels) else 0
+    component_sizes = np.bincount(labels, minlength=component_count)
+    component_species = np.zeros(component_count, dtype=np.int64)
+    component_species[labels] = species
+    clusters = np.bincount(component_species, minlength=size)
+    largest = np.zeros(size, dtype=np.int64)
+    np.maximum.at(largest, component_species, component_sizes)
+    population = np.bincount(species, minlength=size)
+
+    # Each pair is seen once from either side: once per species, twice in total
+    contacts = np.bincount(source_species[contact], minlength=size)
+    histograms = _density_histograms(cells, size)
+    centroids = _centroids(positions, species, size, topology)
+
+    return {
+        'front_length': int(contact.sum()) // 2,
+        'species': {
+            int(species_id): {
+                'clusters': int(clusters[species_id]),
+                'largest_cluster': int(largest[species_id]),
+                'mean_cluster_size': float(population[species_id] / clusters[species_id])
+                if clusters[species_id] else 0.0,
+                'contacts': int(contacts[species_id]),
+                'density_histogram': histograms[species_id].tolist(),
+                'centroid': centroids[species_id],
+            }
+            for species_id in species_ids
+        },
+    }
+
+class SpatialStatsRecorder:
+    def __init__(self, path, interval, topology, species_ids):
+        """Initialize statistics every `interval` steps (0 disables them), appended to a JSON lines file."""
+        self.path = path
+        self.interval = interval
+        self.topology = topology
+        self.species_ids = sorted(species_ids)
+        self.last_step = None
+        self.latest = None  # Most recent statistics, with their step
+        self.thread = None
+        self.output_file = None
+
+    def update(self, step_count, grid, wait=False):
+        """Start computing the statistics of a grid when the interval has passed.
+
+        If the previous statistics are still being computed, this waits for
+        them when `wait` is set and otherwise tries again on the next call.
+        """
+        if not self.interval or (self.last_step is not None and step_count - self.last_step < self.interval):
+            return
+        if wait:
+            self.finish()
+        elif self.thread is not None and self.thread.is_alive():
+            return  # Still computing the previous statistics
+        self.last_step = step_count
+        if self.output_file is None:
+            self.output_file = open(self.path, 'a')
+
+        # Only the copy happens on the calling thread, computing and writing do not
+        self.thread = threading.Thread(
+            target=self._record,
+            args=(step_count, grid.copy()),
+            name="spatial-stats",
+            daemon=True
+        )
+        self.thread.start()
+
+    def finish(self):
+        """Wait for running statistics to be written."""
+        if self.thread is not None:
+            self.thread.join()
+
+    def close(self):
+        """Wait for running statistics and close the output file."""
+        self.finish()
+        if self.output_file is not None:
+            self.output_file.close()
+            self.output_file = None
+
+    def _record(self, step_count, cells):
+        """Compute the statistics of a copy of the cells and append them as one line."""
+        stats = dict(step=step_count, **compute_spatial_stats(cells, self.species_ids, self.topology))
+        self.output_file.write(json.dumps(stats) + "\n")
+        self.output_file.flush()
+        self.latest = stats
+
+def _connected_components(node_count, sources, targets):
+    """Label the components of an undirected graph given as edge arrays (labels 0..count-1)."""
+    if SCIPY_AVAILABLE:
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+        graph = coo_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(node_count, node_count))
+        return connected_components(graph, directed=False)[1]
+
+    # Union-find: hook the larger root of every edge onto the smaller one, then compress paths
+    parent = np.arange(node_count)
+    while True:
+        source_roots = parent[sources]
+        target_roots = parent[targets]
+        split = source_roots != target_roots
+        if not split.any():
+            break
+        np.minimum.at(
+            parent,
+            np.maximum(source_roots[split], target_roots[split]),
+            np.minimum(source_roots[split], target_roots[split])
+        )
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    return np.unique(parent, return_inverse=True)[1]
+
+def _density_histograms(cells, size):
+    """Histogram the share of each species in every full window of SPATIAL_DENSITY_WINDOW cells."""
+    window = SPATIAL_DENSITY_WINDOW
+    rows, cols = cells.shape[0] // window, cells.shape[1] // window
+    histograms = np.zeros((size, SPATIAL_DENSITY_BINS), dtype=np.int64)
+    if rows == 0 or cols == 0:
+        return histograms
+    windows = cells[:rows * window, :cols * window].reshape(rows, window, cols, window)
+    window_index = np.broadcast_to(np.arange(rows * cols).reshape(rows, 1, cols, 1), windows.shape)
+    counts = np.bincount(
+        (window_index * size + windows).reshape(-1).astype(np.int64),
+        minlength=rows * cols * size
+    ).reshape(rows * cols, size)
+    bins = np.minimum(counts * SPATIAL_DENSITY_BINS // (window * window), SPATIAL_DENSITY_BINS - 1)
+    for species_id in range(1, size):
+        histograms[species_id] = np.bincount(bins[:, species_id], minlength=SPATIAL_DENSITY_BINS)
+    return histograms
+
+def _centroids(positions, species, size, topology):
+    """Get the mean (row, column) of every species, a circular mean when the edges wrap."""
+    rows, cols = topology.shape
+    x, y = np.divmod(positions.astype(np.int64), cols)
+    counts = np.bincount(species, minlength=size)
+    centroids = [None] * size
+    coordinates = []
+    for values, extent in ((x, rows), (y, cols)):
+        if topology.wrap:
+            angles = values * (2 * np.pi / extent)
+            sin = np.bincount(species, np.sin(angles), minlength=size)
+            cos = np.bincount(species, np.cos(angles), minlength=size)
+            coordinates.append(np.arctan2(sin, cos) % (2 * np.pi) * (extent / (2 * np.pi)))
+        else:
+            coordinates.append(np.bincount(species, values, minlength=size) / np.maximum(counts, 1))
+    for species_id in np.flatnonzero(counts):
+        centroids[species_id] = [float(coordinates[0][species_id]), float(coordinates[1][species_id])]
+    return centroids
@@ -0,0 +1,11 @@
+"""
+Compact cell storage helpers for the life simulation.
+"""
+
+import numpy as np
+
+def cell_dtype(max_species_id, compact=True):
+    """Get the cell dtype: the smallest unsigned integer that fits every species id when compact."""
+    if not compact:
+        return np.dtype(int)
+    return np.min_scalar_type(max_species_id)
@@ -0,0 +1,137 @@
+"""
+Parallel ensemble and parameter-sweep runner for the life simulation.
+
+Runs replicate headless simulations for every point of a grid of species
+parameter overrides on a process pool, streaming results to disk as they finish.
+"""
+
+import argparse
+import copy
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+from config import ENGINE, SPECIES
+from src.headless import run_headless, save_results
+
+def expand_parameter_grid(parameter_grid):
+    """Expand {"<species_id>.<parameter>": [values]} into a list of override dicts."""
+    keys = sorted(parameter_grid.keys())
+    return [
+        dict(zip(keys, values))
+        for values in itertools.product(*(parameter_grid[key] for key in keys))
+    ]
+
+def apply_overrides(overrides, species=SPECIES):
+    """Create a copy of the species definitions with overrides applied."""
+    species = copy.deepcopy(species)
+    for key, value in overrides.items():
+        species_id, parameter = key.split('.', 1)
+        species_id = int(species_id)
+        if species_id not in species or parameter not in species[species_id]:
+            raise ValueError(f"Unknown species parameter '{key}'")
+        species[species_id][parameter] = value
+    return species
+
+def replicate_seeds(root_seed, point_count, replicates):
+    """Derive an independent, reproducible seed for every (point, replicate) pair."""
+    children = np.random.SeedSequence(root_seed).spawn(point_count * replicates)
+    # Full 128-bit seeds, so replicates of large sweeps never share a stream by chance
+    seeds = [int.from_bytes(child.generate_state(4, np.uint32).tobytes(), 'little') for child in children]
+    return [seeds[point * replicates:(point + 1) * replicates] for point in range(point_count)]
+
+def _run_replicate(task):
+    """Run one replicate in a worker process and write its time series."""
+    point, replicate, overrides, seed, steps, engine, output_dir = task
+    species = apply_overrides(overrides)
+    series_path = os.path.join(output_dir, 'series', f'point{point:04d}_rep{replicate:04d}')
+    results = run_headless(
+        steps, seed, engine=engine, species=species,
+        spatial_path=series_path + '_spatial.jsonl'  # Written only when spatial statistics are enabled
+    )
+    save_results(
+        series_path + '.npz',
+        results,
+        seed,
+        engine
+    )
+
+    # Only the small summary travels back to the parent process
+    species_ids = [int(species_id) for species_id in results['species_ids']]
+    return {
+        'point': point,
+        'replicate': replicate,
+        'seed': seed,
+        'overrides': overrides,
+        'final_populations': dict(zip(species_ids, results['populations'][-1].tolist())),
+        'extinction_steps': dict(zip(species_ids, results['extinction_steps'].tolist())),
+    }
+
+def run_sweep(parameter_grid, replicates, steps, output_dir, seed=0, engine=ENGINE, workers=None):
+    """Run every parameter point `replicates` times across a process pool."""
+    points = expand_parameter_grid(parameter_grid)
+    for overrides in points:
+        apply_overrides(overrides)  # Fail early on unknown parameters
+    seeds = replicate_seeds(seed, len(points), replicates)
+    workers = workers or os.cpu_count()
+
+    os.makedirs(os.path.join(output_dir, 'series'), exist_ok=True)
+    with open(os.path.join(output_dir, 'points.json'), 'w') as points_file:
+        json.dump(points, points_file, indent=2)
+
+    tasks = (
+        (point, replicate, overrides, seeds[point][replicate], steps, engine, output_dir)
+        for point, overrides in enumerate(points)
+        for replicate in range(replicates)
+    )
+
+    completed = 0
+    with open(os.path.join(output_dir, 'summary.jsonl'), 'w') as summary_file, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded number of tasks in flight so results never pile up in memory
+        pending = set()
+        for task in tasks:
+            if len(pending) >= workers * 2:
+                completed += _write_finished(summary_file, pending)
+            pending.add(executor.submit(_run_replicate, task))
+        while pending:
+            completed += _write_finished(summary_file, pending)
+    return completed
+
+def _write_finished(summary_file, pending):
+    """Wait for at least one run to finish and append its summary."""
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        summary_file.write(json.dumps(future.result()) + '\n')
+    summary_file.flush()
+    return len(done)
+
+def main():
+    """Run a sweep described by a JSON parameter grid file."""
+    parser = argparse.ArgumentParser(description="Parameter sweep for the life simulation")
+    parser.add_argument('parameter_grid', help='JSON file mapping "<species_id>.<parameter>" to value lists')
+    parser.add_argument('--replicates', type=int, default=10, help="Runs per parameter point")
+    parser.add_argument('--steps', type=int, default=1000, help="Steps per run")
+    parser.add_argument('--output', default='sweep', help="Output directory")
+    parser.add_argument('--seed', type=int, default=0, help="Root seed for all replicates")
+    parser.add_argument('--engine', default=ENGINE, help="Step engine to use")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    with open(args.parameter_grid) as grid_file:
+        parameter_grid = json.load(grid_file)
+    completed = run_sweep(
+        parameter_grid,
+        args.replicates,
+        args.steps,
+        args.output,
+        args.seed,
+        args.engine,
+        args.workers
+    )
+    print(f"Finished {completed} runs, results in {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Tiled multi-process grid engine for the life simulation.
+
+The torus is split into bands of rows (tiles) that worker processes step in
+place on a grid held in shared memory. A tile reads and writes one halo row on
+each side, so tiles are stepped in phases in which no two active tiles are
+neighbours: every halo row is owned by exactly one active tile at a time, and
+moves, fights and births across tile borders (including the wrap-around) see
+the state left by the previous phase. A copy of the grid from the start of the
+step, also in shared memory, decides which creatures each tile steps and as
+which species, so a creature moved or born into a later tile's rows is not
+stepped twice and one conquered from a neighbouring tile still acts.
+"""
+
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from config import GRID_SIZE, TILE_ROWS, TILE_WORKERS
+from src.grid import Grid
+from src.topology import Topology
+from src.vector_grid import VectorGrid
+
+class TiledGrid(VectorGrid):
+    def __init__(self, seed=None, species=None, size=GRID_SIZE, tile_rows=TILE_ROWS, workers=TILE_WORKERS):
+        """Initialize the grid in shared memory and start the worker pool."""
+        # Only the workers step creatures, so the vectorized engine's scratch buffers are not needed here
+        Grid.__init__(self, seed, species, size)
+        self.back_grid = None
+        workers = workers or os.cpu_count()
+
+        # Move the grid into shared memory so workers can step it in place
+        self.shared_memory = shared_memory.SharedMemory(create=True, size=self.grid.nbytes)
+        grid = np.ndarray(self.grid.shape, dtype=self.grid.dtype, buffer=self.shared_memory.buf)
+        grid[:] = self.grid
+        self.grid = grid
+        self.start_memory = shared_memory.SharedMemory(create=True, size=self.grid.nbytes)
+        self.start_grid = np.ndarray(self.grid.shape, dtype=self.grid.dtype, buffer=self.start_memory.buf)
+
+        # The layout depends only on the tile height and grid size, so a seed gives the same run on any machine,
+        # and larger grids get more tiles to spread over the workers
+        self._set_tiles(size // max(2, tile_rows))
+
+        # Independent random stream per (step, tile), whatever order tiles finish in
+        self.steps = 0
+
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_worker,
+            initargs=(
+                self.shared_memory.name,
+                self.start_memory.name,
+                self.grid.shape,
+                self.grid.dtype.str,
+                self.species,
+                (self.topology.neighbourhood, self.topology.wrap)
+            )
+        )
+        self._finalizer = weakref.finalize(self, _release, self.pool, self.shared_memory, self.start_memory)
+
+    def step(self):
+        """Update the grid state for one simulation step."""
+        self.start_grid[:] = self.grid  # Creatures present at the start of the step
+        for phase in self.phases:
+            futures = [
+                self.pool.submit(_step_tile, *self.tiles[index], (self.seed_entropy, self.steps, index))
+                for index in phase
+            ]
+            for future in futures:
+                self.population += future.result()
+        self.steps += 1
+
+    def get_state(self):
+        """Get the engine state other than the cells as JSON-compatible values."""
+        state = super().get_state()
+        state['steps'] = self.steps
+        state['tile_count'] = len(self.tiles)
+        return state
+
+    def set_state(self, grid, state):
+        """Restore the cells and the engine state saved by get_state."""
+        super().set_state(grid, state)  # Copies into the shared grid
+        self.steps = state['steps']
+        self._set_tiles(state['tile_count'])  # Tiles and their random streams as when saved
+
+    def close(self):
+        """Stop the worker pool and release the shared grid."""
+        self.grid = self.grid.copy()  # Keep the final state readable
+        self.start_grid = None
+        self._finalizer()
+
+    def _set_tiles(self, tile_count):
+        """Split the grid into row bands and group them into phases."""
+        # Tiles need at least two rows so that tiles in the same phase never share a halo row
+        tile_count = max(1, min(tile_count, len(self.grid) // 2))
+        bounds = np.linspace(0, len(self.grid), tile_count + 1).astype(int)
+        self.tiles = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+        self.phases = [
+            [index for index in range(tile_count) if self._tile_phase(index, tile_count) == phase]
+            for phase in range(3)
+        ]
+
+    @staticmethod
+    def _tile_phase(index, tile_count):
+        """Get the phase of a tile: alternate phases, with a third for an odd tile count."""
+        if tile_count > 1 and tile_count % 2 == 1 and index == tile_count - 1:
+            return 2
+        return index % 2
+
+class _TileKernel(VectorGrid):
+    def __init__(self, grid, start_grid, species, topology):
+        """Wrap the shared grid without placing creatures."""
+        self.grid = grid
+        self.start_grid = start_grid
+        self.species = species
+        self.topology = topology
+        self.claim_buffer = np.empty(grid.size, dtype=topology.index_dtype)
+        self._compile_species()
+
+    def step_tile(self, start, end, seed):
+        """Step the creatures in rows [start, end) and return the population change."""
+        self.seed_entropy = seed[0]
+        self.rng = self.substream(*seed[1:])
+        self.population = np.zeros(len(self.combat_strength), dtype=np.int64)
+        cells = self.grid.reshape(-1)
+        cols = self.grid.shape[1]
+        start_cells = self.start_grid.reshape(-1)
+        positions = start * cols + np.flatnonzero(start_cells[start * cols:end * cols])
+
+        # Creatures conquered by a neighbouring tile in an earlier phase still act as their own species
+        self._step(cells, positions, start_cells[positions])
+        return self.population
+
+# Per-process worker state
+_worker = {}
+
+def _attach_worker(name, start_name, shape, dtype, species, topology):
+    """Attach a worker process to the shared grid and its copy from the start of the step."""
+    memory = shared_memory.SharedMemory(name=name)
+    start_memory = shared_memory.SharedMemory(name=start_name)
+    grid = np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf)
+    start_grid = np.ndarray(shape, dtype=np.dtype(dtype), buffer=start_memory.buf)
+    neighbourhood, wrap = topology
+    _worker['memory'] = (memory, start_memory)
+    _worker['kernel'] = _TileKernel(grid, start_grid, species, Topology(neighbourhood, shape, wrap))
+
+def _step_tile(start, end, seed):
+    """Step one tile in a worker process."""
+    return _worker['kernel'].step_tile(start, end, seed)
+
+def _release(pool, *memories):
+    """Shut down the worker pool and free the shared memory."""
+    pool.shutdown()
+    for memory in memories:
+        memory.unlink()
+        try:
+            memory.close()
+        except BufferError:
+            pass  # Views of the old grid are still alive; the mapping goes when they do
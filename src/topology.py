@@ -0,0 +1,70 @@
+"""
+Neighbourhood layouts of the simulation world.
+
+A topology maps flat cell indices (x * cols + y) to the flat indices of their
+neighbours, with -1 for neighbours beyond a wall. The table for the whole grid
+is built on first use when it fits NEIGHBOUR_TABLE_LIMIT entries; larger grids
+compute neighbours with the same arithmetic on demand.
+"""
+
+import numpy as np
+from config import MOVEMENT_DIRECTIONS, NEIGHBOUR_TABLE_LIMIT
+
+# Neighbour offsets (dx, dy) per neighbourhood, for even rows and odd rows
+NEIGHBOURHOODS = {
+    'moore': (MOVEMENT_DIRECTIONS, MOVEMENT_DIRECTIONS),
+    'von_neumann': (
+        [(-1, 0), (0, -1), (0, 1), (1, 0)],
+        [(-1, 0), (0, -1), (0, 1), (1, 0)]
+    ),
+    # Hexagons in offset rows: odd rows are shifted half a cell to the right
+    'hex': (
+        [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)],
+        [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)]
+    ),
+}
+
+class Topology:
+    def __init__(self, neighbourhood, shape, wrap=True):
+        """Initialize the neighbour offsets of a grid of the given shape."""
+        if neighbourhood not in NEIGHBOURHOODS:
+            raise ValueError(
+                f"Unknown neighbourhood '{neighbourhood}', choose one of: {', '.join(NEIGHBOURHOODS)}"
+            )
+        if neighbourhood == 'hex' and wrap and shape[0] % 2:
+            raise ValueError("A wrapped hex grid needs an even number of rows")
+        self.neighbourhood = neighbourhood
+        self.shape = shape
+        self.wrap = wrap
+        self.offsets = np.array(NEIGHBOURHOODS[neighbourhood])  # (row parity, direction, axis)
+        self.degree = self.offsets.shape[1]
+        self.index_dtype = np.int32 if shape[0] * shape[1] < 2 ** 31 else np.int64
+        self._table = None
+
+    @property
+    def table(self):
+        """Get the (cells, degree) neighbour table, or None if the grid is too large for one."""
+        cell_count = self.shape[0] * self.shape[1]
+        if self._table is None and cell_count * self.degree <= NEIGHBOUR_TABLE_LIMIT:
+            positions = np.arange(cell_count, dtype=self.index_dtype)
+            self._table = self._compute(positions[:, None], np.arange(self.degree))
+        return self._table
+
+    def neighbours(self, positions, direction_index):
+        """Get flat neighbour indices of positions in the given directions (broadcast), -1 beyond walls."""
+        table = self.table
+        if table is not None:
+            return table[positions, direction_index]
+        return self._compute(positions, direction_index)
+
+    def _compute(self, positions, direction_index):
+        """Compute neighbour indices with modulo arithmetic."""
+        rows, cols = self.shape
+        x, y = np.divmod(positions, cols)
+        offsets = self.offsets[x % 2, direction_index]
+        x = x + offsets[..., 0]
+        y = y + offsets[..., 1]
+        if self.wrap:
+            return ((x % rows) * cols + y % cols).astype(self.index_dtype)
+        inside = (x >= 0) & (x < rows) & (y >= 0) & (y < cols)
+        return np.where(inside, x * cols + y, -1).astype(self.index_dtype)
@@ -9,6 +9,7 @@ from config import (
     BUTTON_HEIGHT, BUTTON_DISABLED_COLOR, BORDER_RADIUS,
     HOVER_TRANSITION_SPEED
 )
+from src.ui.text import render_text
 
 class Button:
     def __init__(self, text, action, tooltip=None, icon=None, disabled=False):
@@ -49,22 +50,15 @@ class Button:
         )
         
         # Draw text with icon
-        text_surface = font.render(
-            f"{self.icon + ' ' if self.icon else ''}{self.text}",
-            True,
-            BUTTON_TEXT_COLOR
-        )
+        label = f"{self.icon + ' ' if self.icon else ''}{self.text}"
+        text_surface = render_text(font, label, BUTTON_TEXT_COLOR)
         
         # Center text
         text_x = x + (width - text_surface.get_width()) // 2
         text_y = y + (BUTTON_HEIGHT - text_surface.get_height()) // 2
         
         # Draw text shadow for depth
-        shadow_surface = font.render(
-            f"{self.icon + ' ' if self.icon else ''}{self.text}",
-            True,
-            (0, 0, 0, 100)
-        )
+        shadow_surface = render_text(font, label, (0, 0, 0, 100))
         surface.blit(shadow_surface, (text_x, text_y + 1))
         surface.blit(text_surface, (text_x, text_y))
         
@@ -79,6 +73,11 @@ class Button:
             )
             surface.blit(highlight, self.rect)
     
+    def is_animating(self):
+        """Check if the hover animation has not yet settled."""
+        target_hover = 1.0 if self.is_hovered(pygame.mouse.get_pos()) and not self.disabled else 0.0
+        return abs(target_hover - self.hover) > 0.01
+    
     def is_hovered(self, pos):
         """Check if the mouse is over the button."""
         return self.rect is not None and self.rect.collidepoint(pos)
@@ -0,0 +1,99 @@
+"""
+Cell layer that draws the part of the grid in view with array operations.
+"""
+
+import pygame
+import numpy as np
+from config import BACKGROUND_COLOR, GRID_COLOR
+
+# Overlay color that is keyed out so cell pixels show through
+OVERLAY_KEY_COLOR = (255, 0, 255)
+
+# Grid lines are only drawn when cells are large enough to show between them
+MIN_GRID_CELL_SIZE = 4
+
+class CellLayer:
+    def __init__(self, species, show_grid=False):
+        """Initialize the palettes and the per-unit surfaces."""
+        # Species id -> RGB lookup table (id 0 is an empty cell)
+        self.palette = np.zeros((max(species.keys()) + 1, 3), dtype=np.uint8)
+        self.palette[0] = BACKGROUND_COLOR
+        for species_id, species_data in species.items():
+            self.palette[species_id] = species_data['color']
+        self.lod_palettes = {}  # Samples per block side -> block summary palette
+
+        # One pixel per shown unit, scaled up to the zoom level when drawn
+        self.unit_surface = None
+        self.scaled_surface = None
+        self.set_show_grid(show_grid)
+
+    def set_show_grid(self, show_grid):
+        """Toggle grid lines, dropping the cell styling overlays."""
+        self.show_grid = show_grid
+        self.overlays = {}  # Cell size -> overlay
+
+    def draw(self, surface, values, viewport):
+        """Draw the units sampled by the viewport onto a surface of the view size."""
+        (_, _, rows, columns), (x, y) = viewport.get_window()
+        palette = self._get_lod_palette(viewport.samples) if viewport.zoomed_out else self.palette
+        unit_pixels = viewport.unit_pixels
+        size = (columns * unit_pixels, rows * unit_pixels)
+
+        # Surface arrays are indexed (x, y), the values are indexed (row, column)
+        if self.unit_surface is None or self.unit_surface.get_size() != (columns, rows):
+            self.unit_surface = pygame.Surface((columns, rows))
+        pygame.surfarray.blit_array(self.unit_surface, palette[values.T])
+
+        # Margins around a world smaller than the view
+        if not pygame.Rect((x, y), size).contains(surface.get_rect()):
+            surface.fill(BACKGROUND_COLOR)
+
+        if unit_pixels == 1:
+            surface.blit(self.unit_surface, (x, y))
+            return
+        if self.scaled_surface is None or self.scaled_surface.get_size() != size:
+            self.scaled_surface = pygame.Surface(size)
+        pygame.transform.scale(self.unit_surface, size, self.scaled_surface)
+        surface.blit(self.scaled_surface, (x, y))
+
+        overlay = self._get_overlay(unit_pixels, viewport.view_size)
+        if overlay is not None:
+            surface.blit(overlay, (x, y), (0, 0) + size)
+
+    def _get_lod_palette(self, samples):
+        """Get the palette of block summaries: the majority species shaded by the occupied share of samples."""
+        palette = self.lod_palettes.get(samples)
+        if palette is None:
+            count = samples * samples
+            share = (np.arange(count + 1) / count)[None, :, None]
+            background = self.palette[0].astype(np.float64)
+            palette = background + (self.palette[:, None, :] - background) * share
+            palette = np.rint(palette).astype(np.uint8).reshape(-1, 3)
+            self.lod_palettes[samples] = palette
+        return palette
+
+    def _create_tile_mask(self, cell_size):
+        """Create the per-cell pixel mask: 0 = cell, 1 = gap, 2 = grid line."""
+        mask = np.zeros((cell_size, cell_size), dtype=np.uint8)
+        if self.show_grid and cell_size >= MIN_GRID_CELL_SIZE:
+            # Cells are inset by one pixel on each side of the grid lines
+            mask[-1, :] = 1
+            mask[:, -1] = 1
+            mask[0, :] = 2
+            mask[:, 0] = 2
+        return mask
+
+    def _get_overlay(self, cell_size, view_size):
+        """Get the mask tiled over the view (plus a partly shown cell) as a color-keyed overlay surface."""
+        if cell_size not in self.overlays:
+            mask = self._create_tile_mask(cell_size)
+            overlay = None
+            if mask.any():
+                tiles = view_size // cell_size + 2
+                colors = np.array([OVERLAY_KEY_COLOR, BACKGROUND_COLOR, GRID_COLOR], dtype=np.uint8)
+                pixels = colors[np.tile(mask, (tiles, tiles))]
+                overlay = pygame.Surface(pixels.shape[:2])
+                pygame.surfarray.blit_array(overlay, pixels)
+                overlay.set_colorkey(OVERLAY_KEY_COLOR)
+            self.overlays[cell_size] = overlay
+        return self.overlays[cell_size]
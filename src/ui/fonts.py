@@ -0,0 +1,60 @@
+"""
+Font loading with system font resolution cached across launches.
+
+Finding a system font by name scans every installed font (through fc-list on
+Linux), which is a large share of startup time. The font file each name
+resolves to is saved to FONT_CACHE_PATH (in the per-user cache directory), so
+later launches open the file directly and skip the scan. Fonts that are not
+installed are not cached, so they are found once they are installed.
+"""
+
+import json
+import os
+import pygame
+from config import FONT_CACHE_PATH
+
+_resolved = None  # (name, bold) key -> [font file, synthetic bold]
+
+def load_font(name, size, bold=False):
+    """Load a system font like pygame.font.SysFont, resolving its file at most once per machine."""
+    resolved = _get_resolved()
+    key = f"{name}|{int(bold)}"
+    entry = resolved.get(key)
+    if entry is not None and (entry[0] is None or not os.path.exists(entry[0])):
+        entry = None  # The font was uninstalled since it was cached
+    if entry is None:
+        # Let SysFont pick the file and style without loading it (no file when it falls back to the default font)
+        entry = list(pygame.font.SysFont(name, size, bold, constructor=lambda path, size, bold, italic: (path, bold)))
+        if entry[0] is not None:
+            resolved[key] = entry
+            _save_resolved(resolved)
+
+    path, synthetic_bold = entry
+    font = pygame.font.Font(path, size)
+    if synthetic_bold:
+        font.set_bold(True)
+    return font
+
+def _get_resolved():
+    """Get the resolved fonts, reading the cache file on first use."""
+    global _resolved
+    if _resolved is None:
+        _resolved = {}
+        if FONT_CACHE_PATH is not None:
+            try:
+                with open(FONT_CACHE_PATH) as cache_file:
+                    _resolved = json.load(cache_file)
+            except (OSError, ValueError):
+                pass  # Missing or unreadable cache, fonts are resolved again
+    return _resolved
+
+def _save_resolved(resolved):
+    """Write the resolved fonts to the cache file."""
+    if FONT_CACHE_PATH is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_PATH), exist_ok=True)
+        with open(FONT_CACHE_PATH, 'w') as cache_file:
+            json.dump(resolved, cache_file, indent=2)
+    except OSError:
+        pass  # Read-only location, fonts are resolved again next launch
@@ -6,44 +6,51 @@ import pygame
 import numpy as np
 
 class PopulationGraph:
-    def __init__(self, width, height, history_length):
-        """Initialize the population graph."""
+    def __init__(self, width, height, steps=None):
+        """Initialize the population graph showing the last `steps` steps (None is the whole run)."""
         self.width = width
         self.height = height
-        self.history_length = history_length
-        self.graph_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.steps = steps
+        self.graph_surface = None
+        self.drawn_version = None  # History version shown on graph_surface
         self.max_scale = 10000  # Fixed maximum scale for Y-axis
         
-    def draw(self, surface, pos, population_history, species_data):
-        """Draw the population graph with clear lines."""
-        self.graph_surface.fill((0, 0, 0, 0))  # Clear with transparency
+        # Add small padding to the graph edges
+        self.padding = 0.05
+        self.v_padding = 0.1
+        self.columns = max(1, int(self.width * (1 - 2 * self.padding)))  # One history column per pixel
         
-        if not population_history or not any(population_history.values()):
-            return
-            
-        # Draw background
+        # Static background and grid lines, rendered once
+        self.background_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         pygame.draw.rect(
-            self.graph_surface,
+            self.background_surface,
             (30, 33, 39, 200),  # More opaque background
             (0, 0, self.width, self.height),
             border_radius=4
         )
-        
-        # Draw grid lines for better readability
         self._draw_grid()
         
-        # Find the maximum length of history across all species
-        max_history_length = max(len(history) for history in population_history.values() if history)
-        if max_history_length == 0:
+    def draw(self, surface, pos, population_history, species_data):
+        """Draw the population graph with clear lines, re-rasterizing it only when the history changed."""
+        if population_history.last_step is None:
             return
         
-        # Draw population lines for each species
-        for species_id, history in population_history.items():
-            if not history:
-                continue
-                
+        if population_history.version != self.drawn_version:
+            self.drawn_version = population_history.version
+            self._render(population_history, species_data)
+        
+        # Draw the graph on the target surface
+        surface.blit(self.graph_surface, pos)
+    
+    def _render(self, population_history, species_data):
+        """Draw the population lines over a copy of the static background."""
+        self.graph_surface = self.background_surface.copy()
+        
+        # Draw population lines for each species from a fixed-size summary of the history
+        _, _, mean = population_history.query(self.steps, self.columns)
+        for index, species_id in enumerate(population_history.species_ids):
             color = species_data[species_id]['color']
-            points = self._get_curve_points(history, max_history_length)
+            points = self._get_curve_points(mean[:, index])
             
             if len(points) > 1:
                 # Draw thicker line for better visibility
@@ -65,9 +72,6 @@ class PopulationGraph:
                     4
                 )
         
-        # Draw the graph on the target surface
-        surface.blit(self.graph_surface, pos)
-        
     def _draw_grid(self):
         """Draw background grid lines."""
         grid_color = (100, 100, 100, 50)  # Light gray, semi-transparent
@@ -77,46 +81,26 @@ class PopulationGraph:
         for i in range(num_lines + 1):
             y = int(self.height * (1 - i / num_lines))
             pygame.draw.line(
-                self.graph_surface,
+                self.background_surface,
                 grid_color,
                 (0, y),
                 (self.width, y)
             )
     
-    def _get_curve_points(self, history, max_history_length):
-        """Convert population history to graph points."""
-        if not history:
+    def _get_curve_points(self, values):
+        """Convert one column of history values to graph points, skipping columns without samples."""
+        columns = np.flatnonzero(~np.isnan(values))
+        if len(columns) == 0:
             return []
-            
-        points = []
         
-        # Add small padding to the graph edges
-        padding = 0.05
-        usable_width = self.width * (1 - 2 * padding)
+        # Scale values based on the fixed maximum, with padding on every side
+        usable_width = self.width * (1 - 2 * self.padding)
+        usable_height = self.height * (1 - 2 * self.v_padding)
+        scaled_values = np.minimum(values[columns] / self.max_scale, 1.0)
+        y = (self.height * self.v_padding) + (usable_height * (1 - scaled_values))
         
         # Handle single point case
-        if max_history_length == 1:
-            x = self.width / 2  # Center point
-            value = history[0]
-            scaled_value = min(value / self.max_scale, 1.0)
-            v_padding = 0.1
-            usable_height = self.height * (1 - 2 * v_padding)
-            y = (self.height * v_padding) + (usable_height * (1 - scaled_value))
-            return [(x, y)]
-        
-        # Calculate points using actual history length for x-scale
-        for i, value in enumerate(history):
-            # Scale x position based on current history length
-            x = (self.width * padding) + (i * usable_width / (max_history_length - 1))
-            
-            # Scale value based on fixed maximum
-            scaled_value = min(value / self.max_scale, 1.0)
-            
-            # Add padding to vertical scale
-            v_padding = 0.1
-            usable_height = self.height * (1 - 2 * v_padding)
-            y = (self.height * v_padding) + (usable_height * (1 - scaled_value))
-            
-            points.append((x, y))
-            
-        return points 
\ No newline at end of file
+        if len(columns) == 1:
+            return [(self.width / 2, float(y[0]))]  # Center point
+        x = (self.width * self.padding) + columns * usable_width / max(self.columns - 1, 1)
+        return np.column_stack([x, y]).tolist()
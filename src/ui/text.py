@@ -0,0 +1,46 @@
+"""
+Shared cache of rendered text surfaces.
+"""
+
+from collections import OrderedDict
+from config import TEXT_CACHE_SIZE
+
+class TextCache:
+    def __init__(self, size=TEXT_CACHE_SIZE):
+        """Initialize an empty cache holding at most `size` surfaces."""
+        self.size = size
+        self.surfaces = OrderedDict()  # Least recently used first
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Get the antialiased rendering of a string, rasterizing it only on a miss."""
+        return self.get((font, text, color), lambda: font.render(text, True, color))
+
+    def get(self, key, create):
+        """Get the surface stored under a key, creating it with `create()` on a miss.
+
+        Cached surfaces are shared, so callers must only blit them, never draw on them.
+        """
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = create()
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces."""
+        self.surfaces.clear()
+
+# Shared by the renderer and all UI components
+text_cache = TextCache()
+
+def render_text(font, text, color):
+    """Render a string through the shared text cache."""
+    return text_cache.render(font, text, color)
@@ -4,14 +4,13 @@ Tooltip component for displaying hover information.
 
 import pygame
 import pygame.gfxdraw
+from src.ui.text import render_text, text_cache
 
 class Tooltip:
     @staticmethod
-    def draw(surface, pos, text, font, bg_color, text_color, padding):
-        """Draw a modern tooltip at the specified position."""
-        # Render text
-        text_surface = font.render(text, True, text_color)
-        text_width, text_height = text_surface.get_size()
+    def get_rect(screen_size, pos, text, font, padding):
+        """Get the screen rectangle a tooltip at the specified position covers."""
+        text_width, text_height = font.size(text)
         
         # Calculate tooltip dimensions
         tooltip_width = text_width + padding * 2
@@ -19,7 +18,7 @@ class Tooltip:
         
         # Calculate position (try to keep tooltip on screen)
         x, y = pos
-        screen_width, screen_height = surface.get_size()
+        screen_width, screen_height = screen_size
         
         # Adjust x position if tooltip would go off screen
         if x + tooltip_width + 10 > screen_width:
@@ -32,7 +31,30 @@ class Tooltip:
             y = y - tooltip_height - 5
         else:
             y += 10
-            
+        
+        return pygame.Rect(x, y, tooltip_width, tooltip_height)
+    
+    @staticmethod
+    def draw(surface, pos, text, font, bg_color, text_color, padding):
+        """Draw a modern tooltip at the specified position and return its rectangle."""
+        tooltip_rect = Tooltip.get_rect(surface.get_size(), pos, text, font, padding)
+        
+        # The finished tooltip is cached, so hovering does not re-render it every frame
+        tooltip_surface = text_cache.get(
+            ('tooltip', font, text, bg_color, text_color, padding),
+            lambda: Tooltip._create_surface(tooltip_rect.size, text, font, bg_color, text_color, padding)
+        )
+        
+        # Draw tooltip on main surface
+        return surface.blit(tooltip_surface, tooltip_rect.topleft)
+    
+    @staticmethod
+    def _create_surface(size, text, font, bg_color, text_color, padding):
+        """Render the tooltip background and text onto a new surface."""
+        # Render text
+        text_surface = render_text(font, text, text_color)
+        tooltip_width, tooltip_height = size
+        
         # Create tooltip surface with alpha
         tooltip_surface = pygame.Surface((tooltip_width, tooltip_height), pygame.SRCALPHA)
         
@@ -44,6 +66,4 @@ class Tooltip:
         text_x = padding
         text_y = padding
         tooltip_surface.blit(text_surface, (text_x, text_y))
-        
-        # Draw tooltip on main surface
-        surface.blit(tooltip_surface, (x, y)) 
\ No newline at end of file
+        return tooltip_surface
@@ -0,0 +1,180 @@
+"""
+Zoomable, pannable view of the world.
+
+The view shows a window of the world at a zoom level. Zoomed in, every cell
+covers `cell_pixels` screen pixels and only the cells in view are read. Zoomed
+out, every screen pixel summarizes a block of `block` x `block` cells by the
+majority species of a fixed sample of its cells, so the work per frame depends
+on the number of window pixels and not on the size of the world.
+"""
+
+import math
+import numpy as np
+from config import CELL_SIZE, MAX_CELL_SIZE, LOD_SAMPLES
+
+class Viewport:
+    def __init__(self, world_size, view_size, cell_size=CELL_SIZE):
+        """Initialize the view at `cell_size` pixels per cell, zoomed out until the world fits if needed."""
+        self.world_size = world_size
+        self.view_size = view_size
+        self.cell_pixels = cell_size  # Screen pixels per cell when zoomed in
+        self.block = 1  # Cells per screen pixel when zoomed out
+        self.origin = [0.0, 0.0]  # World (row, column) shown at the top-left of the view
+        self.version = 0  # Incremented on every change of the view
+        self._zoom_to_fit()
+
+    @property
+    def zoomed_out(self):
+        """Check if screen pixels summarize blocks of cells."""
+        return self.block > 1
+
+    @property
+    def unit_pixels(self):
+        """Get the screen pixels per shown unit (a cell, or a block of cells when zoomed out)."""
+        return self.cell_pixels
+
+    @property
+    def samples(self):
+        """Get the number of cells sampled per block side when zoomed out."""
+        return min(self.block, LOD_SAMPLES)
+
+    def zoom(self, steps, anchor=None):
+        """Zoom in (positive steps) or out by factors of two, keeping the world point under `anchor` in place."""
+        if anchor is None:
+            anchor = (self.view_size // 2, self.view_size // 2)
+        # World point under the anchor (x is the column, y the row)
+        point = [self._to_world(anchor[1], 0), self._to_world(anchor[0], 1)]
+
+        for _ in range(abs(steps)):
+            if steps > 0:
+                if self.block > 1:
+                    self.block //= 2
+                elif self.cell_pixels * 2 <= MAX_CELL_SIZE:
+                    self.cell_pixels *= 2
+            elif not self._fits():  # Zooming out stops once the whole world is in view
+                if self.cell_pixels > 1:
+                    self.cell_pixels //= 2
+                else:
+                    self.block *= 2
+
+        scale = self._scale()
+        margin = self._margin()
+        self.origin = [point[0] - (anchor[1] - margin) / scale, point[1] - (anchor[0] - margin) / scale]
+        self._clamp()
+        self.version += 1
+
+    def pan(self, dx, dy):
+        """Move the view by a screen distance in pixels."""
+        scale = self._scale()
+        self.origin = [self.origin[0] - dy / scale, self.origin[1] - dx / scale]
+        self._clamp()
+        self.version += 1
+
+    def fit(self):
+        """Show the whole world at the largest zoom it fits in."""
+        self.cell_pixels = MAX_CELL_SIZE
+        self.block = 1
+        self.origin = [0.0, 0.0]
+        self._zoom_to_fit()
+        self.version += 1
+
+    def get_window(self):
+        """Get the shown units as (first row, first column, rows, columns) and their screen offset (x, y)."""
+        first_row, rows, y = self._axis(self.origin[0])
+        first_column, columns, x = self._axis(self.origin[1])
+        return (first_row, first_column, rows, columns), (x, y)
+
+    def sample(self, grid):
+        """Get the shown units of a grid as palette indices for the current zoom level.
+
+        Zoomed in, these are the species ids of the cells in view (a copy).
+        Zoomed out, the index of a block is `majority * (samples ** 2 + 1) + occupied`,
+        where `majority` is the species voted for by its sampled cells (0 if
+        all are empty) and `occupied` the number of sampled cells holding a
+        creature.
+        """
+        (first_row, first_column, rows, columns), _ = self.get_window()
+        if not self.zoomed_out:
+            return grid[first_row:first_row + rows, first_column:first_column + columns].copy()
+
+        # A fixed lattice of samples x samples cells in every block, one plane of the lattice at a time
+        samples = self.samples
+        stride = self.block // samples
+        row_lattice = [self._lattice(first_row, rows, stride * index + stride // 2) for index in range(samples)]
+        column_lattice = [self._lattice(first_column, columns, stride * index + stride // 2) for index in range(samples)]
+        planes = [
+            grid[np.ix_(row_cells, column_cells)]
+            if isinstance(row_cells, np.ndarray) and isinstance(column_cells, np.ndarray)
+            else grid[row_cells, column_cells]
+            for row_cells in row_lattice for column_cells in column_lattice
+        ]
+        majority, occupied = _majority_vote(planes)
+        return majority.astype(np.int64) * (samples * samples + 1) + occupied
+
+    def _zoom_to_fit(self):
+        """Zoom out from the current zoom level until the whole world is in view."""
+        while not self._fits() and self.cell_pixels > 1:
+            self.cell_pixels //= 2
+        while not self._fits():
+            self.block *= 2
+
+    def _fits(self):
+        """Check if the whole world is in view."""
+        return self._world_units() * self.unit_pixels <= self.view_size
+
+    def _world_units(self):
+        """Get the world size in shown units."""
+        return -(-self.world_size // self.block)
+
+    def _scale(self):
+        """Get the screen pixels per cell."""
+        return self.cell_pixels / self.block
+
+    def _margin(self):
+        """Get the screen offset of the world when it is smaller than the view (centred)."""
+        return max(0, (self.view_size - self._world_units() * self.unit_pixels) // 2)
+
+    def _clamp(self):
+        """Keep the view inside the world."""
+        visible = self.view_size / self._scale()
+        for axis in range(2):
+            self.origin[axis] = min(max(self.origin[axis], 0.0), max(0.0, self.world_size - visible))
+
+    def _to_world(self, pixel, axis):
+        """Get the world coordinate (row for axis 0, column for axis 1) at a view pixel."""
+        return self.origin[axis] + (pixel - self._margin()) / self._scale()
+
+    def _lattice(self, first, count, offset):
+        """Get the cells at `offset` in `count` blocks from block `first` along an axis, as a slice when in range."""
+        start = first * self.block + offset
+        if start + (count - 1) * self.block < self.world_size:
+            return slice(start, start + (count - 1) * self.block + 1, self.block)
+        # The last block extends past the world, sample its last cell instead
+        return np.minimum(start + np.arange(count) * self.block, self.world_size - 1)
+
+    def _axis(self, origin):
+        """Get the first shown unit, the number of shown units and their screen offset along one axis."""
+        position = origin / self.block
+        first = int(position)
+        offset = self._margin() - int(round((position - first) * self.unit_pixels))
+        count = min(self._world_units() - first, math.ceil((self.view_size - offset) / self.unit_pixels))
+        return first, count, offset
+
+def _majority_vote(planes):
+    """Vote for a species per block over planes of samples, ignoring empty cells (Boyer-Moore majority vote).
+
+    The vote finds the species holding more than half of the occupied samples
+    whenever there is one, in a single pass over the planes. Returns the voted
+    species (0 where all samples are empty) and the number of occupied samples.
+    """
+    candidate = np.zeros(planes[0].shape, dtype=planes[0].dtype)
+    votes = np.zeros(planes[0].shape, dtype=np.int16)
+    occupied = np.zeros(planes[0].shape, dtype=np.int16)
+    for plane in planes:
+        present = plane != 0
+        occupied += present
+        candidate = np.where(present & (votes == 0), plane, candidate)
+        match = present & (plane == candidate)
+        votes += match
+        votes -= present & ~match
+    return candidate, occupied
@@ -0,0 +1,146 @@
+"""
+Vectorized grid engine for the life simulation.
+"""
+
+import numpy as np
+from config import GRID_SIZE
+from src.grid import Grid
+
+class VectorGrid(Grid):
+    def __init__(self, seed=None, species=None, size=GRID_SIZE):
+        """Initialize the grid without a back buffer."""
+        super().__init__(seed, species, size)
+        self.back_grid = None  # Stepped in place, no back buffer needed
+        self.claim_buffer = np.empty(self.grid.size, dtype=self.topology.index_dtype)  # Scratch per cell, e.g. the first turn touching it
+
+    def step(self):
+        """Update the grid state for one simulation step."""
+        cells = self.grid.reshape(-1)  # Flat view, written in place
+        positions = np.flatnonzero(cells)
+        self._step(cells, positions)
+
+    def _step(self, cells, positions, species=None):
+        """Run movement, combat and reproduction, returning the new creature positions.
+
+        Creatures act one after another in a random order, each moving and then
+        reproducing like in the reference engine. Creatures whose cells no earlier
+        waiting creature may write act together in one round, which gives the same
+        result as acting one after another. `species` is what each creature was at
+        the start of the step, by default the species in its cell.
+        """
+        species = cells[positions] if species is None else species
+        degree = self.topology.degree
+        rolls = self.rng.random((3, len(positions)))
+        directions = self.rng.integers(degree, size=len(positions))
+
+        # Only creatures that move or reproduce can change the cells (nowhere to go beyond a wall)
+        moves = rolls[0] < self.movement_chance[species]
+        targets = np.where(moves, self.topology.neighbours(positions, directions), -1)
+        breeds = rolls[1] < self.reproduction_chance[species]
+        creatures = self.rng.permutation(np.flatnonzero((targets >= 0) | breeds))
+        sources, species, targets, combat_rolls, breeds = (
+            positions[creatures], species[creatures], targets[creatures], rolls[2][creatures], breeds[creatures]
+        )
+        turns = np.arange(len(creatures), dtype=self.claim_buffer.dtype)
+        parents = turns[breeds]
+        neighbours = self.topology.neighbours(sources[parents, None], np.arange(degree))
+
+        movers = turns[targets >= 0]
+        mover_sources, mover_targets = sources[movers], targets[movers]
+        vacates, may_empty = self._vacancies(cells, mover_sources, mover_targets, neighbours)
+
+        # Parents without a neighbour that may be empty can never give birth
+        fertile = may_empty.any(axis=1)
+        parents, neighbours, may_empty = parents[fertile], neighbours[fertile], may_empty[fertile]
+        birth_keys = self.rng.random(neighbours.shape)
+        birth_rows = np.full(len(creatures), -1)
+        birth_rows[parents] = np.arange(len(parents))
+
+        # Every cell a creature may read or write, with its turn: the target of a mover, the own cell of a
+        # mover that may leave it, and the birth cells that may be empty. A mover facing a cell that never
+        # empties can only fight, so its own cell stays as it is
+        touched = np.concatenate([mover_sources[vacates], mover_targets, neighbours[may_empty]])
+        touched_turns = np.concatenate([
+            movers[vacates], movers, np.broadcast_to(parents[:, None], neighbours.shape)[may_empty]
+        ])
+
+        positions = positions.copy()
+        births = []
+        blocked = np.empty(len(creatures), dtype=bool)
+        waiting = turns
+        while len(waiting):
+            # A creature acts once every cell it touches is no longer touched by an earlier waiting creature
+            self.claim_buffer[touched] = len(creatures)
+            np.minimum.at(self.claim_buffer, touched, touched_turns)
+            blocked[waiting] = False
+            blocked[touched_turns[self.claim_buffer[touched] != touched_turns]] = True
+            acting = waiting[~blocked[waiting]]
+
+            moved = self._move(cells, sources[acting], species[acting], targets[acting], combat_rolls[acting])
+            positions[creatures[acting[moved]]] = targets[acting[moved]]
+            rows = birth_rows[acting]
+            rows = rows[rows >= 0]
+            births.append(self._reproduce(cells, species[parents[rows]], neighbours[rows], birth_keys[rows]))
+
+            waiting = waiting[blocked[waiting]]
+            still = blocked[touched_turns]
+            touched, touched_turns = touched[still], touched_turns[still]
+        return np.concatenate([positions, *births])
+
+    def _vacancies(self, cells, mover_sources, mover_targets, neighbours):
+        """Find the movers that may leave their cell, and the neighbours that may be empty during the step.
+
+        A cell may be empty at some point if it starts empty or its creature moves
+        towards a cell that may be empty; any other cell stays occupied all step.
+        """
+        self.claim_buffer[mover_targets] = -1
+        self.claim_buffer[neighbours] = -1
+        self.claim_buffer[mover_sources] = np.arange(len(mover_sources))
+        leaving = self.claim_buffer[mover_targets]  # Mover starting in each target cell, -1 if none
+
+        # Follow chains of movers that each face the cell of the next one
+        vacates = cells[mover_targets] == 0
+        while True:
+            chained = vacates | ((leaving >= 0) & vacates[leaving])
+            if np.array_equal(chained, vacates):
+                break
+            vacates = chained
+
+        neighbour_movers = self.claim_buffer[neighbours]
+        may_empty = (neighbours >= 0) & (
+            (cells[neighbours] == 0) | ((neighbour_movers >= 0) & vacates[neighbour_movers])
+        )
+        return vacates, may_empty
+
+    def _move(self, cells, sources, species, targets, combat_rolls):
+        """Move creatures into empty cells or fight the occupants, returning which ones moved."""
+        occupants = cells[targets]
+        moved = (targets >= 0) & (occupants == 0)
+
+        # A creature conquered earlier in the step still moves, taking its cell back from the winner
+        vacated = cells[sources[moved]]
+        cells[sources[moved]] = 0
+        cells[targets[moved]] = species[moved]
+        self.population += np.bincount(species[moved], minlength=len(self.population))
+        self.population -= np.bincount(vacated, minlength=len(self.population))
+
+        # Fights with different species
+        hostile = (targets >= 0) & (occupants != 0) & (occupants != species)
+        attackers, defenders, targets = species[hostile], occupants[hostile], targets[hostile]
+        won = combat_rolls[hostile] < self.win_probability[attackers, defenders]
+        cells[targets[won]] = attackers[won]
+        self.population += np.bincount(attackers[won], minlength=len(self.population))
+        self.population -= np.bincount(defenders[won], minlength=len(self.population))
+        return moved
+
+    def _reproduce(self, cells, species, neighbours, keys):
+        """Place offspring into a random empty neighbour of each parent, returning their cells."""
+        # Random key per neighbour; occupied neighbours can never be picked
+        keys = np.where((neighbours >= 0) & (cells[neighbours] == 0), keys, 2.0)
+        choice = keys.argmin(axis=1)
+        rows = np.arange(len(neighbours))
+        has_room = keys[rows, choice] < 2.0
+        births = neighbours[rows, choice][has_room]
+        cells[births] = species[has_room]
+        self.population += np.bincount(species[has_room], minlength=len(self.population))
+        return births
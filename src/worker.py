@@ -0,0 +1,164 @@
+"""
+Simulation stepping, either inline on the main thread or on a background worker thread.
+"""
+
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from config import FRAME_RATE
+from src.profiler import Profiler
+from src.scheduler import StepScheduler
+
+# A consistent view of the simulation for drawing
+Snapshot = namedtuple('Snapshot', ['grid', 'stats', 'step_count', 'extinction_data'])
+
+class SimulationWorker:
+    def __init__(self, grid, steps_per_second, profiler=None):
+        """Initialize the worker around a grid."""
+        self.grid = grid
+        self.profiler = profiler or Profiler()  # Times the phases of each step
+        self.scheduler = StepScheduler(steps_per_second)
+        self.step_count = 0  # Step counter
+        self.extinction_data = {}  # Track when species go extinct
+        self.paused = False
+        self.step_lock = threading.Lock()  # Held while a step is in progress
+        self.recorder = None  # Optional Recorder that receives every step
+        
+        # Background mode state
+        self.thread = None
+        self.lock = threading.Lock()
+        self.running = threading.Event()  # Set while not paused
+        self.running.set()
+        self.stopping = threading.Event()
+        self.buffers = None  # Three grid copies: published, being drawn and being written
+        self.readers = None  # Snapshots of each buffer being drawn
+        self.published_index = None
+        self.published = None
+    
+    def advance(self, elapsed, budget):
+        """Run the steps owed for `elapsed` seconds within `budget` seconds and return how many ran."""
+        deadline = time.perf_counter() + budget
+        if self.scheduler.turbo:
+            # Turbo: as many steps as fit in the budget, but always at least one
+            steps = 0
+            while steps == 0 or time.perf_counter() < deadline:
+                self.step()
+                steps += 1
+            return steps
+        
+        steps = self.scheduler.steps_due(elapsed)
+        for done in range(1, steps + 1):
+            self.step()
+            if time.perf_counter() > deadline:
+                return done  # Steps that do not fit are dropped to keep up with real time
+        return steps
+    
+    def step(self):
+        """Advance the grid by one step and record extinctions."""
+        profiler = self.profiler
+        with self.step_lock:
+            with profiler.phase("step"):
+                self.grid.step()
+            self.step_count += 1
+            
+            # Check for extinctions
+            with profiler.phase("stats"):
+                for species_id, count in self.grid.stats().items():
+                    if count == 0 and species_id not in self.extinction_data:
+                        self.extinction_data[species_id] = self.step_count
+            
+            if self.recorder is not None:
+                with profiler.phase("record"):
+                    self.recorder.record(self.grid.grid, self.step_count, self.extinction_data)
+    
+    def set_paused(self, paused):
+        """Pause or resume stepping."""
+        self.paused = paused
+        self.scheduler.reset()
+        if paused:
+            self.running.clear()
+        else:
+            self.running.set()
+    
+    def set_rate(self, steps_per_second):
+        """Change the step rate (None is turbo)."""
+        self.scheduler.set_rate(steps_per_second)
+    
+    @contextmanager
+    def snapshot(self):
+        """Get the latest complete simulation state; hold it only while drawing."""
+        if self.thread is None:
+            yield Snapshot(
+                self.grid.grid,
+                self.grid.stats(),
+                self.step_count,
+                self.extinction_data
+            )
+            return
+        
+        # The lock is only held to pick the buffer, so publishing never waits for drawing
+        with self.lock:
+            index = self.published_index
+            snapshot = self.published
+            self.readers[index] += 1
+        try:
+            yield snapshot
+        finally:
+            with self.lock:
+                self.readers[index] -= 1
+    
+    def start(self):
+        """Start stepping on a background thread."""
+        self.buffers = [self.grid.snapshot() for _ in range(3)]
+        self.readers = [0] * len(self.buffers)
+        self._publish()
+        self.thread = threading.Thread(target=self._run, name="simulation-worker", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop the background thread and wait for it to finish."""
+        if self.thread is None:
+            return
+        self.stopping.set()
+        self.running.set()  # Wake the thread if it is paused
+        self.thread.join()
+        self.thread = None
+    
+    def _run(self):
+        """Step the grid and publish a snapshot once per frame interval."""
+        frame_time = 1 / FRAME_RATE
+        last_time = time.perf_counter()
+        while not self.stopping.is_set():
+            if not self.running.wait(0.1):
+                last_time = time.perf_counter()
+                continue
+            
+            tick_start = time.perf_counter()
+            elapsed = tick_start - last_time
+            last_time = tick_start
+            if self.advance(elapsed, frame_time) > 0:
+                self._publish()
+            
+            # Sleep out the rest of the frame interval unless running uncapped
+            if not self.scheduler.turbo:
+                time.sleep(max(0.0, tick_start + frame_time - time.perf_counter()))
+    
+    def _publish(self):
+        """Copy the grid into a buffer that is neither published nor being drawn, then publish it."""
+        with self.lock:
+            back = next(
+                index for index in range(len(self.buffers))
+                if index != self.published_index and self.readers[index] == 0
+            )
+        with self.profiler.phase("publish"):
+            self.grid.snapshot(self.buffers[back])
+            snapshot = Snapshot(
+                self.buffers[back],
+                self.grid.stats(),
+                self.step_count,
+                dict(self.extinction_data)
+            )
+        with self.lock:
+            self.published_index = back
+            self.published = snapshot